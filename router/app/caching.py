@@ -0,0 +1,62 @@
+"""
+Small async caching helpers for the router service
+Used to collapse repeated Docker and backend probes from status polling
+"""
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+def async_ttl_cache(ttl: float) -> Callable:
+    """
+    Cache the result of an async function per argument tuple for ``ttl`` seconds.
+
+    Concurrent callers for the same arguments share a single in-flight call
+    (single-flight), and its result then serves everyone until it expires.
+    Cached values are shared between callers, so callers must copy them
+    before mutating.
+
+    The wrapped function gets an ``invalidate(*args)`` helper that drops the
+    entry for those arguments, or the whole cache when called without any.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        inflight: Dict[Tuple, asyncio.Task] = {}
+
+        async def refresh(key: Tuple) -> Any:
+            try:
+                value = await func(*key)
+                # Don't store a result that was invalidated while in flight
+                if inflight.get(key) is asyncio.current_task():
+                    cache[key] = (time.monotonic(), value)
+                return value
+            finally:
+                if inflight.get(key) is asyncio.current_task():
+                    del inflight[key]
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any) -> Any:
+            entry = cache.get(args)
+            if entry and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+            task = inflight.get(args)
+            if task is None:
+                task = asyncio.ensure_future(refresh(args))
+                inflight[args] = task
+            # A cancelled caller must not cancel the call other callers are awaiting
+            return await asyncio.shield(task)
+
+        def invalidate(*args: Any) -> None:
+            if args:
+                cache.pop(args, None)
+                inflight.pop(args, None)
+            else:
+                cache.clear()
+                inflight.clear()
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
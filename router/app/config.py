@@ -1,7 +1,6 @@
 """
 Configuration management for router service
 """
-import os
 from typing import Dict
 from pydantic_settings import BaseSettings
 
@@ -10,14 +9,27 @@ class Settings(BaseSettings):
     """Application settings"""
 
     # API Authentication
-    api_key: str = os.getenv("API_KEY", "sk-local-dev-key")
+    api_key: str = "sk-local-dev-key"
 
     # Backend URLs
-    coder_backend_url: str = os.getenv("CODER_BACKEND_URL", "http://vllm-coder:8000")
-    general_backend_url: str = os.getenv("GENERAL_BACKEND_URL", "http://vllm-general:8000")
+    coder_backend_url: str = "http://vllm-coder:8000"
+    general_backend_url: str = "http://vllm-general:8000"
+    gpt_oss_120b_backend_url: str = "http://vllm-gpt-oss-120b:8000"
+    gpt_oss_20b_backend_url: str = "http://vllm-gpt-oss-20b:8000"
+
+    # Model management (docker compose)
+    docker_compose_file: str = "/docker-compose.yml"
+    host_project_dir: str = "/home/asvil/git/local_llm_service"  # Fallback for local dev
+    docker_socket: str = "/var/run/docker.sock"
+    docker_max_concurrency: int = 4  # Concurrent docker CLI subprocesses
+    models_dir: str = "/models"  # HuggingFace cache shared with the vLLM containers
+
+    # Server
+    router_port: str = "8080"
+    router_workers: int = 1  # uvicorn worker processes (WEB_CONCURRENCY in the container)
 
     # Logging
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_level: str = "INFO"
 
     # CORS Origins
     cors_origins: list = [
@@ -34,6 +46,7 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = False
+        extra = "ignore"  # .env also carries settings for the other services
 
 
 # Global settings instance
@@ -45,7 +58,6 @@ def get_model_routing() -> Dict[str, str]:
     """Get model to backend URL mapping"""
     return {
         "deepseek-coder-33b-instruct": settings.coder_backend_url,
-        "deepseek-coder-33B-instruct": settings.coder_backend_url,
         "mistral-7b-v0.1": settings.general_backend_url,
         "qwen-2.5-14b-instruct": settings.general_backend_url,
     }
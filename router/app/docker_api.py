@@ -0,0 +1,127 @@
+"""
+Minimal Docker Engine API client for the router service
+Talks to the Docker daemon over its unix socket instead of spawning the
+docker CLI for every container query or lifecycle action
+"""
+import logging
+import struct
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Stop/restart wait up to the container's stop timeout (10s by default) before replying
+DOCKER_API_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+class DockerClient:
+    """Async client for the subset of the Docker Engine API the router uses"""
+
+    def __init__(self, socket_path: str = "/var/run/docker.sock") -> None:
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=socket_path),
+            base_url="http://docker",
+            timeout=DOCKER_API_TIMEOUT,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def inspect_container(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the container's inspect data, or None if it does not exist"""
+        try:
+            response = await self._client.get(f"/containers/{name}/json")
+        except httpx.HTTPError as e:
+            logger.error("Docker API inspect failed for %s: %s", name, e)
+            return None
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    async def list_containers(self, include_stopped: bool = False) -> List[Dict[str, Any]]:
+        """List containers (running only unless ``include_stopped`` is set)"""
+        try:
+            response = await self._client.get(
+                "/containers/json", params={"all": str(include_stopped).lower()}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("Docker API container list failed: %s", e)
+            return []
+        return response.json()
+
+    async def container_logs(self, name: str, tail: int = 100) -> Optional[str]:
+        """Return the last ``tail`` lines of stdout and stderr, or None on failure"""
+        try:
+            response = await self._client.get(
+                f"/containers/{name}/logs",
+                params={"stdout": "true", "stderr": "true", "tail": str(tail)},
+            )
+        except httpx.HTTPError as e:
+            logger.error("Docker API logs failed for %s: %s", name, e)
+            return None
+        if response.status_code != 200:
+            return None
+        return _demux_log_stream(response.content).decode(errors="replace")
+
+    async def container_pids(self, name: str) -> Optional[Set[int]]:
+        """Host PIDs of the processes in a running container, or None on failure"""
+        try:
+            response = await self._client.get(f"/containers/{name}/top")
+        except httpx.HTTPError as e:
+            logger.error("Docker API top failed for %s: %s", name, e)
+            return None
+        if response.status_code != 200:
+            return None
+        top = response.json()
+        pid_column = top["Titles"].index("PID")
+        return {int(process[pid_column]) for process in top.get("Processes") or []}
+
+    async def start_container(self, name: str) -> Tuple[bool, str]:
+        return await self._post(f"/containers/{name}/start")
+
+    async def stop_container(self, name: str) -> Tuple[bool, str]:
+        return await self._post(f"/containers/{name}/stop")
+
+    async def restart_container(self, name: str) -> Tuple[bool, str]:
+        return await self._post(f"/containers/{name}/restart")
+
+    async def _post(self, path: str) -> Tuple[bool, str]:
+        """Run a container action; returns (success, message) like run_docker_command"""
+        logger.info("Docker API request: POST %s", path)
+        try:
+            response = await self._client.post(path)
+        except httpx.HTTPError as e:
+            return False, str(e)
+        return _action_result(response)
+
+
+def _action_result(response: httpx.Response) -> Tuple[bool, str]:
+    """Map an action response to (success, message); 304 means already in that state"""
+    if response.status_code in (200, 204, 304):
+        return True, ""
+    try:
+        return False, response.json().get("message", response.text)
+    except ValueError:
+        return False, response.text
+
+
+def _demux_log_stream(data: bytes) -> bytes:
+    """
+    Strip Docker's stream multiplexing headers from log output.
+
+    Containers without a TTY prefix each frame with an 8-byte header
+    (stream type, 3 padding bytes, big-endian payload length). TTY
+    containers return raw output, which is passed through unchanged.
+    """
+    if len(data) < 8 or data[0] not in (0, 1, 2) or data[1:4] != b"\x00\x00\x00":
+        return data
+
+    frames = []
+    offset = 0
+    while offset + 8 <= len(data):
+        (size,) = struct.unpack(">I", data[offset + 4:offset + 8])
+        frames.append(data[offset + 8:offset + 8 + size])
+        offset += 8 + size
+    return b"".join(frames)
@@ -0,0 +1,93 @@
+"""
+GPU memory readings through NVML
+Queries the driver in-process instead of spawning nvidia-smi for every poll
+"""
+import logging
+from typing import Dict, Optional, Tuple
+
+try:
+    import pynvml
+    PYNVML_AVAILABLE = True
+except ImportError:
+    PYNVML_AVAILABLE = False
+    logging.warning("pynvml not available - GPU memory will be read with nvidia-smi")
+
+logger = logging.getLogger(__name__)
+
+_nvml_initialized = False
+
+
+def init_nvml() -> bool:
+    """
+    Initialize NVML once for the process.
+
+    Returns False when the bindings are missing or the driver library is not
+    reachable (e.g. the container was started without GPU access), in which
+    case callers fall back to nvidia-smi.
+    """
+    global _nvml_initialized
+    if _nvml_initialized:
+        return True
+    if not PYNVML_AVAILABLE:
+        return False
+
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError as e:
+        logger.warning(f"NVML initialization failed, falling back to nvidia-smi: {e}")
+        return False
+
+    _nvml_initialized = True
+    logger.info(f"NVML initialized ({pynvml.nvmlDeviceGetCount()} GPU(s))")
+    return True
+
+
+def shutdown_nvml() -> None:
+    """Release NVML if it was initialized"""
+    global _nvml_initialized
+    if _nvml_initialized:
+        pynvml.nvmlShutdown()
+        _nvml_initialized = False
+
+
+def read_gpu_memory_mb() -> Optional[Tuple[int, int]]:
+    """Return (used_mb, total_mb) summed over all GPUs, or None if NVML is unavailable"""
+    if not _nvml_initialized:
+        return None
+
+    try:
+        used = total = 0
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            memory = pynvml.nvmlDeviceGetMemoryInfo(pynvml.nvmlDeviceGetHandleByIndex(index))
+            used += memory.used
+            total += memory.total
+    except pynvml.NVMLError as e:
+        logger.error(f"NVML memory query failed: {e}")
+        return None
+
+    return used // (1024 * 1024), total // (1024 * 1024)
+
+
+def read_process_gpu_memory_mb() -> Optional[Dict[int, int]]:
+    """
+    Return GPU memory used per compute process (host PID -> MB) over all GPUs.
+
+    Returns None if NVML is unavailable. The driver reports host PIDs, so
+    they can be matched against the PIDs Docker lists for a container.
+    """
+    if not _nvml_initialized:
+        return None
+
+    usage: Dict[int, int] = {}
+    try:
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            for process in pynvml.nvmlDeviceGetComputeRunningProcesses(handle):
+                # None when the driver cannot attribute memory (e.g. some vGPU setups)
+                if process.usedGpuMemory is not None:
+                    usage[process.pid] = usage.get(process.pid, 0) + process.usedGpuMemory // (1024 * 1024)
+    except pynvml.NVMLError as e:
+        logger.error(f"NVML process query failed: {e}")
+        return None
+
+    return usage
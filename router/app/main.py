@@ -4,19 +4,27 @@ Routes requests to appropriate vLLM backend based on model parameter
 """
 import os
 import logging
+import math
+import re
+import secrets
 import time
-import uuid
-import subprocess
+import itertools
 import asyncio
-from typing import Dict, Any, Optional, List
+import fcntl
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Set, Tuple
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 
-from fastapi import FastAPI, Request, Response, HTTPException, Depends
+from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import StreamingResponse, JSONResponse
-from pydantic import BaseModel, Field, ConfigDict
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
+from sse_starlette.sse import EventSourceResponse
 import httpx
+import orjson
 from typing import Union
 
 # Tool calling modules
@@ -26,18 +34,15 @@ from .transformations import (
     validate_tool_result_messages,
     create_error_response
 )
-from .tool_parsing import (
-    generate_tool_call_id,
-    extract_tool_calls_from_text,
-    validate_tool_exists
-)
-from .streaming import (
-    stream_with_tool_detection,
-    simple_stream_passthrough
-)
+from .streaming import stream_with_tool_detection
+from .caching import async_ttl_cache
+from .docker_api import DockerClient
+from .gpu import init_nvml, read_gpu_memory_mb, read_process_gpu_memory_mb, shutdown_nvml
+from .middleware import AuthMiddleware, EventStreamAwareGZipMiddleware
+from .config import settings
 
 # Configure logging with enhanced format
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL = settings.log_level
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Add detailed format for ERROR level
@@ -75,19 +80,26 @@ for handler in logging.getLogger().handlers:
 # Log startup
 logger.info(f"Starting vLLM Router - Log Level: {LOG_LEVEL}")
 
-# Configuration
-API_KEY = os.getenv("API_KEY", "sk-local-dev-key")
-CODER_BACKEND_URL = os.getenv("CODER_BACKEND_URL", "http://vllm-coder:8000")
-GENERAL_BACKEND_URL = os.getenv("GENERAL_BACKEND_URL", "http://vllm-general:8000")
-GPT_OSS_120B_BACKEND_URL = os.getenv("GPT_OSS_120B_BACKEND_URL", "http://vllm-gpt-oss-120b:8000")
-GPT_OSS_20B_BACKEND_URL = os.getenv("GPT_OSS_20B_BACKEND_URL", "http://vllm-gpt-oss-20b:8000")
-DOCKER_COMPOSE_FILE = os.getenv("DOCKER_COMPOSE_FILE", "/docker-compose.yml")
-HOST_PROJECT_DIR = os.getenv("HOST_PROJECT_DIR", "/home/asvil/git/local_llm_service")  # Fallback for local dev
+# Configuration (read once from the environment by Settings)
+API_KEY = settings.api_key
+CODER_BACKEND_URL = settings.coder_backend_url
+GENERAL_BACKEND_URL = settings.general_backend_url
+GPT_OSS_120B_BACKEND_URL = settings.gpt_oss_120b_backend_url
+GPT_OSS_20B_BACKEND_URL = settings.gpt_oss_20b_backend_url
+DOCKER_COMPOSE_FILE = settings.docker_compose_file
+HOST_PROJECT_DIR = settings.host_project_dir
+MODELS_HUB_DIR = os.path.join(settings.models_dir, "hub")
+
+
+# Headers sent with every chat completion forwarded to a backend (JSON body)
+_BACKEND_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json",
+}
 
-# Model routing configuration
+# Model routing configuration (model names are matched case-insensitively)
 MODEL_ROUTING = {
     "deepseek-coder-33b-instruct": CODER_BACKEND_URL,
-    "deepseek-coder-33B-instruct": CODER_BACKEND_URL,  # Case variation
     "mistral-7b-v0.1": GENERAL_BACKEND_URL,
     "qwen-2.5-14b-instruct": GENERAL_BACKEND_URL,
     "gpt-oss-120b": GPT_OSS_120B_BACKEND_URL,
@@ -97,155 +109,184 @@ MODEL_ROUTING = {
 # Model name mapping (friendly name -> backend model name)
 MODEL_NAME_MAPPING = {
     "deepseek-coder-33b-instruct": "TheBloke/deepseek-coder-33B-instruct-AWQ",
-    "deepseek-coder-33B-instruct": "TheBloke/deepseek-coder-33B-instruct-AWQ",
     "mistral-7b-v0.1": "TheBloke/Mistral-7B-v0.1-AWQ",
     "qwen-2.5-14b-instruct": "TheBloke/Qwen2.5-14B-Instruct-AWQ",
     "gpt-oss-120b": "openai/gpt-oss-120b",
     "gpt-oss-20b": "openai/gpt-oss-20b",
 }
 
+# Lowercase model name -> (backend URL, backend model name), built once at import
+_MODEL_ROUTING_LC = {
+    model.lower(): (backend_url, MODEL_NAME_MAPPING.get(model, model))
+    for model, backend_url in MODEL_ROUTING.items()
+}
+
+# Distinct backend URLs; several models can share one backend
+_UNIQUE_BACKENDS = tuple(dict.fromkeys(MODEL_ROUTING.values()))
+
 # HTTP client for backend requests
 http_client: Optional[httpx.AsyncClient] = None
 
-# Security
-security = HTTPBearer()
+# Docker Engine API client for container status and lifecycle actions
+docker_client: Optional[DockerClient] = None
 
+# Streaming completions hold a pooled connection for minutes, so size the pool
+# well above httpx's defaults and keep idle connections to the backends warm
+BACKEND_POOL_LIMITS = httpx.Limits(
+    max_connections=512,
+    max_keepalive_connections=256,
+    keepalive_expiry=60.0
+)
+BACKEND_TIMEOUT = httpx.Timeout(connect=5.0, read=300.0, write=30.0, pool=5.0)  # 5 minute read for long generations
+# Completions may pause for minutes between tokens (or before a non-streamed
+# reply), so only connecting, writing and waiting for the pool are bounded
+COMPLETION_TIMEOUT = httpx.Timeout(connect=5.0, read=None, write=60.0, pool=10.0)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Lifecycle manager for FastAPI app"""
-    global http_client
 
-    # Startup
-    logger.info("Starting router service")
-    logger.info(f"Coder backend: {CODER_BACKEND_URL}")
-    logger.info(f"General backend: {GENERAL_BACKEND_URL}")
+# Lock file shared by all workers in the container; held for the process lifetime
+AUTO_START_LOCK_FILE = "/tmp/vllm-router-autostart.lock"
+_auto_start_lock_fd: Optional[int] = None
+
+
+def _acquire_auto_start_lock() -> bool:
+    """Take the auto-start lock without blocking; False if another worker holds it"""
+    global _auto_start_lock_fd
+    fd = os.open(AUTO_START_LOCK_FILE, os.O_CREAT | os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return False
+    _auto_start_lock_fd = fd
+    return True
+
+
+# Models stopped at startup may take longer to release memory than during a switch
+AUTO_START_RELEASE_TIMEOUT = 60.0  # seconds
 
-    http_client = httpx.AsyncClient(timeout=300.0)  # 5 minute timeout for long generations
 
+async def auto_start_largest_model():
+    """Start the largest downloaded model, unloading running models if needed"""
     # Wait for Docker network to be ready
     await asyncio.sleep(5)
 
     # Auto-start the largest downloaded model at startup
     logger.info("Auto-starting largest downloaded model at startup...")
 
-    # Check which models are downloaded
-    downloaded_models = []
-    for model_name, metadata in MODEL_METADATA.items():
-        hf_path = metadata.get('hf_path')
-        if hf_path:
-            download_info = await check_model_downloaded(hf_path)
-            if download_info.get('downloaded'):
-                downloaded_models.append((model_name, metadata['gpu_memory_gb']))
-                logger.info(f"  {model_name}: Downloaded ({metadata['gpu_memory_gb']}GB)")
-            else:
-                logger.info(f"  {model_name}: Not downloaded")
+    # Check which models are downloaded (all checks run concurrently)
+    specs = [spec for spec in MODELS.values() if spec.model_dir]
+    download_infos = await asyncio.gather(*(check_model_downloaded(spec.name) for spec in specs))
+
+    # Track the largest downloaded model while logging each result
+    largest: Optional[ModelSpec] = None
+    for spec, download_info in zip(specs, download_infos):
+        if download_info.get('downloaded'):
+            logger.info(f"  {spec.name}: Downloaded ({spec.gpu_memory_gb}GB)")
+            if largest is None or spec.gpu_memory_gb > largest.gpu_memory_gb:
+                largest = spec
+        else:
+            logger.info(f"  {spec.name}: Not downloaded")
 
-    if downloaded_models:
+    if largest:
         # Start the largest downloaded model with smart memory management
-        largest_model = max(downloaded_models, key=lambda x: x[1])
-        model_name, required_memory_gb = largest_model
+        model_name, required_memory_gb = largest.name, largest.gpu_memory_gb
 
         logger.info(f"Auto-starting {model_name} ({required_memory_gb}GB GPU memory)...")
 
         try:
             # Check if already running
-            container_name = CONTAINER_NAMES.get(model_name)
-            if not container_name:
-                logger.warning(f"No container mapping found for {model_name}")
+            container_name = MODELS[model_name].container
+            status = await get_container_status(container_name)
+
+            if status["status"] == "running":
+                logger.info(f"{model_name} is already running")
             else:
-                status = await get_container_status(container_name)
+                # First check if there are running containers to unload
+                running_names = await list_running_containers()
+                running_model_containers = []
+
+                for running_name in running_names:
+                    running_spec = MODELS_BY_CONTAINER.get(running_name)
+                    if running_spec and running_name != container_name:
+                        running_model_containers.append({
+                            "name": running_spec.name,
+                            "container": running_spec.container,
+                            "gpu_memory_gb": running_spec.gpu_memory_gb
+                        })
+
+                # If there are running containers, stop them first
+                should_start = True
+                if running_model_containers:
+                    logger.info(f"Found {len(running_model_containers)} running model(s), unloading before auto-start...")
+                    # Sort by GPU memory (largest first)
+                    running_model_containers.sort(key=lambda m: m["gpu_memory_gb"], reverse=True)
+
+                    for model in running_model_containers:
+                        logger.info(f"Stopping {model['name']} ({model['gpu_memory_gb']}GB)")
+                        await docker_client.stop_container(model['container'])
+
+                    # Wait and verify GPU memory is actually released
+                    available_gb = await wait_for_gpu_memory(required_memory_gb, timeout=AUTO_START_RELEASE_TIMEOUT)
+                    if available_gb >= required_memory_gb:
+                        logger.info(f"✓ Sufficient memory available: {available_gb:.2f}GB >= {required_memory_gb}GB")
+                    else:
+                        logger.error(f"Timeout waiting for memory release. Available: {available_gb:.2f}GB < Required: {required_memory_gb}GB. Skipping auto-start.")
+                        should_start = False
+                else:
+                    # No running containers, but still check available memory
+                    gpu_info = await get_gpu_memory_info()
+                    available_gb = gpu_info["available_gb"]
+                    logger.info(f"No running models found. Available memory: {available_gb:.2f}GB, Required: {required_memory_gb}GB")
 
-                if status["status"] == "running":
-                    logger.info(f"{model_name} is already running")
+                    if available_gb < required_memory_gb:
+                        logger.error(f"Insufficient GPU memory for {model_name}. Need {required_memory_gb}GB but only {available_gb:.2f}GB available. Skipping auto-start.")
+                        should_start = False
+
+                # Now start the model if we have enough memory
+                if not should_start:
+                    logger.warning(f"Skipping auto-start of {model_name} due to insufficient memory")
                 else:
-                    # First check if there are running containers to unload
-                    all_containers = await run_docker_command(["docker", "ps", "--format", "{{.Names}}"])
-                    running_model_containers = []
-
-                    if all_containers[0]:  # success
-                        for line in all_containers[1].strip().split('\n'):
-                            if line.startswith('vllm-') and line != container_name:
-                                # Find model name for this container
-                                for m_name, c_name in CONTAINER_NAMES.items():
-                                    if c_name == line:
-                                        m_metadata = MODEL_METADATA.get(m_name, {})
-                                        running_model_containers.append({
-                                            "name": m_name,
-                                            "container": c_name,
-                                            "gpu_memory_gb": m_metadata.get("gpu_memory_gb", 0)
-                                        })
-                                        break
-
-                    # If there are running containers, stop them first
-                    should_start = True
-                    if running_model_containers:
-                        logger.info(f"Found {len(running_model_containers)} running model(s), unloading before auto-start...")
-                        # Sort by GPU memory (largest first)
-                        running_model_containers.sort(key=lambda m: m["gpu_memory_gb"], reverse=True)
-
-                        for model in running_model_containers:
-                            logger.info(f"Stopping {model['name']} ({model['gpu_memory_gb']}GB)")
-                            await run_docker_command(["docker", "stop", model['container']])
-
-                        # Wait and verify GPU memory is actually released
-                        logger.info("Waiting for GPU memory to be released...")
-                        max_wait_cycles = 20  # 20 * 3 seconds = 60 seconds max
-                        for i in range(max_wait_cycles):
-                            await asyncio.sleep(3)
-                            gpu_info = await get_gpu_memory_info()
-                            available_gb = gpu_info["available_gb"]
-                            logger.info(f"  Check {i+1}/{max_wait_cycles}: {available_gb:.2f}GB free")
-
-                            if available_gb >= required_memory_gb:
-                                logger.info(f"✓ Sufficient memory available: {available_gb:.2f}GB >= {required_memory_gb}GB")
-                                break
-                        else:
-                            # Timeout reached - check if we have enough anyway
-                            if available_gb < required_memory_gb:
-                                logger.error(f"Timeout waiting for memory release. Available: {available_gb:.2f}GB < Required: {required_memory_gb}GB. Skipping auto-start.")
-                                should_start = False
-                    else:
-                        # No running containers, but still check available memory
-                        gpu_info = await get_gpu_memory_info()
-                        available_gb = gpu_info["available_gb"]
-                        logger.info(f"No running models found. Available memory: {available_gb:.2f}GB, Required: {required_memory_gb}GB")
-
-                        if available_gb < required_memory_gb:
-                            logger.error(f"Insufficient GPU memory for {model_name}. Need {required_memory_gb}GB but only {available_gb:.2f}GB available. Skipping auto-start.")
-                            should_start = False
-
-                    # Now start the model if we have enough memory
-                    if not should_start:
-                        logger.warning(f"Skipping auto-start of {model_name} due to insufficient memory")
+                    success, output = await run_compose_command(
+                        MODELS[model_name].profile, "up", "-d", container_name
+                    )
+
+                    if success:
+                        logger.info(f"Successfully started {model_name}")
                     else:
-                        profile = CONTAINER_PROFILES.get(container_name)
-                        project_dir = os.path.dirname(DOCKER_COMPOSE_FILE)
-                        compose_cmd_base = ["docker", "compose", "-f", DOCKER_COMPOSE_FILE, "-p", "local-llm-service"]
-                        if profile:
-                            compose_cmd_base.extend(["--profile", profile])
-
-                        compose_env = {"PWD": HOST_PROJECT_DIR}
-                        success, output = await run_docker_command(
-                            compose_cmd_base + ["up", "-d", container_name],
-                            cwd=project_dir,
-                            env=compose_env
-                        )
-
-                        if success:
-                            logger.info(f"Successfully started {model_name}")
-                        else:
-                            logger.error(f"Failed to start {model_name}: {output}")
+                        logger.error(f"Failed to start {model_name}: {output}")
         except Exception as e:
             logger.error(f"Error during auto-start: {e}")
     else:
         logger.warning("No downloaded models found, skipping auto-start")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifecycle manager for FastAPI app"""
+    global http_client, docker_client
+
+    # Startup
+    logger.info("Starting router service")
+    logger.info(f"Coder backend: {CODER_BACKEND_URL}")
+    logger.info(f"General backend: {GENERAL_BACKEND_URL}")
+
+    http_client = httpx.AsyncClient(timeout=BACKEND_TIMEOUT, limits=BACKEND_POOL_LIMITS)
+    docker_client = DockerClient(settings.docker_socket)
+    init_nvml()
+
+    # With several workers, only the one holding the lock auto-starts a model
+    if _acquire_auto_start_lock():
+        await auto_start_largest_model()
+    else:
+        logger.info("Model auto-start is handled by another worker")
+
     yield
 
     # Shutdown
     logger.info("Shutting down router service")
     await http_client.aclose()
+    await docker_client.aclose()
+    shutdown_nvml()
 
 
 # Create FastAPI app
@@ -253,12 +294,12 @@ app = FastAPI(
     title="Local LLM Service Router",
     description="OpenAI-compatible API router for local vLLM backends",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Exception handler for validation errors (422)
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -269,7 +310,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     logger.error(f"Validation errors: {error_details}")
 
     # Return OpenAI-compatible error response
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": {
@@ -282,6 +323,14 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
+# Bearer auth for the /v1 API; registered first so it is the innermost layer
+# and auth errors still get CORS headers
+app.add_middleware(AuthMiddleware, api_key=API_KEY, public_paths=frozenset({"/v1/api/info"}))
+
+# Compress larger JSON responses (e.g. non-streaming completions); registered
+# before CORS so it runs inside the CORS middleware. SSE streams are never compressed.
+app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # CORS configuration - allow all origins for remote access
 app.add_middleware(
     CORSMiddleware,
@@ -293,38 +342,6 @@ app.add_middleware(
     max_age=600,  # Reduced to force more frequent preflight checks
 )
 
-# Additional middleware to ensure CORS headers on all responses
-@app.middleware("http")
-async def add_cors_headers(request: Request, call_next):
-    response = await call_next(request)
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
-    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, Accept, Origin, X-Requested-With"
-    response.headers["Access-Control-Expose-Headers"] = "*"
-    return response
-
-
-# ============================================================================
-# Authentication
-# ============================================================================
-
-def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    """Verify API key from Bearer token"""
-    if credentials.credentials != API_KEY:
-        logger.warning(f"Invalid API key attempt")
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": {
-                    "message": "Invalid API key provided",
-                    "type": "invalid_request_error",
-                    "code": "invalid_api_key"
-                }
-            }
-        )
-    return credentials.credentials
-
-
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -377,34 +394,39 @@ class ChatCompletionRequest(BaseModel):
     stream_options: Optional[Dict[str, Any]] = None
 
 
-class ModelInfo(BaseModel):
-    id: str
-    object: str = "model"
-    created: int
-    owned_by: str = "vllm"
-    status: str = "ready"
+# ============================================================================
+# Utility Functions
+# ============================================================================
+
+# Request ids only correlate log lines, so a per-process prefix and a counter suffice
+_REQUEST_ID_PREFIX = secrets.token_hex(3)
+_request_counter = itertools.count()
 
 
-class ModelList(BaseModel):
-    object: str = "list"
-    data: List[ModelInfo]
+def new_request_id() -> str:
+    """Return a short process-unique id for correlating a request's log lines"""
+    return f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
 
 
-# ============================================================================
-# Utility Functions
-# ============================================================================
+async def read_json_body(raw_request: Request) -> Any:
+    """Parse the request body with orjson, reporting malformed JSON as a validation error"""
+    body = await raw_request.body()
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error"}])
 
-def get_backend_url(model: str) -> str:
-    """Route model to appropriate backend"""
-    backend_url = MODEL_ROUTING.get(model.lower())
-    if not backend_url:
-        # Try partial match
-        for model_key, url in MODEL_ROUTING.items():
-            if model_key in model.lower() or model.lower() in model_key:
-                backend_url = url
-                break
 
-    if not backend_url:
+@lru_cache(maxsize=128)
+def _lookup_model(model: str) -> Optional[Tuple[str, str]]:
+    """Cached routing lookup keyed by the model string exactly as clients send it"""
+    return _MODEL_ROUTING_LC.get(model.lower())
+
+
+def resolve_model(model: str) -> Tuple[str, str]:
+    """Route model to appropriate backend, returning (backend_url, backend_model)"""
+    route = _lookup_model(model)
+    if route is None:
         raise HTTPException(
             status_code=400,
             detail={
@@ -415,17 +437,21 @@ def get_backend_url(model: str) -> str:
                 }
             }
         )
+    return route
 
-    return backend_url
 
+# Backend health results are cached briefly so frequent pollers share one probe
+HEALTH_CHECK_TTL = 2.0  # seconds
 
+
+@async_ttl_cache(ttl=HEALTH_CHECK_TTL)
 async def check_backend_health(backend_url: str) -> Dict[str, Any]:
-    """Check if backend is healthy and ready"""
+    """Check if backend is healthy and ready (cached for HEALTH_CHECK_TTL seconds)"""
     try:
         response = await http_client.get(f"{backend_url}/health", timeout=5.0)
         return {"status": "healthy" if response.status_code == 200 else "unhealthy"}
     except Exception as e:
-        logger.error(f"Backend health check failed for {backend_url}: {e}")
+        logger.error("Backend health check failed for %s: %s", backend_url, e)
         return {"status": "unhealthy", "error": str(e)}
 
 
@@ -443,21 +469,21 @@ async def health():
 async def readiness():
     """
     Readiness check - returns 200 when at least one backend model is ready
-    Aggregates health from both backends
+    Aggregates health from all backends, probing each backend URL once
     """
-    coder_health = await check_backend_health(CODER_BACKEND_URL)
-    general_health = await check_backend_health(GENERAL_BACKEND_URL)
+    results = await asyncio.gather(*(check_backend_health(url) for url in _UNIQUE_BACKENDS))
+    health_by_url = dict(zip(_UNIQUE_BACKENDS, results))
 
     models_status = {
-        "deepseek-coder-33b-instruct": coder_health.get("status", "unhealthy"),
-        "mistral-7b-v0.1": general_health.get("status", "unhealthy"),
+        model: health_by_url[backend_url].get("status", "unhealthy")
+        for model, (backend_url, _) in _MODEL_ROUTING_LC.items()
     }
 
     # At least one model must be healthy
     if any(status == "healthy" for status in models_status.values()):
         return {"status": "ready", "models": models_status}
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "not_ready", "models": models_status}
         )
@@ -470,169 +496,293 @@ async def readiness():
 @app.get("/v1/api/info")
 async def get_api_info():
     """Get API connection information - no auth required for UI display"""
-    router_port = os.getenv("ROUTER_PORT", "8080")
     return {
         "api_key": API_KEY,
-        "router_port": router_port,
+        "router_port": settings.router_port,
     }
 
 
 @app.get("/v1/models")
-async def list_models(api_key: str = Depends(verify_api_key)):
+async def list_models():
     """List available models - only returns running and healthy models"""
-    models = []
-
     # Get status of all models
-    statuses = await get_models_status(api_key)
+    statuses = await collect_model_statuses()
     all_models = statuses.get("models", {})
 
-    # Only include models that are running and healthy
-    for model_name, status in all_models.items():
-        if status.get("status") == "running" and status.get("health") == "healthy":
-            models.append(ModelInfo(
-                id=model_name,
-                created=int(time.time()),
-                status="ready"
-            ))
+    # Only include models that are running and healthy; plain dicts are
+    # serialized straight by orjson without a Pydantic round-trip
+    created = int(time.time())
+    models = [
+        {"id": model_name, "object": "model", "created": created, "owned_by": "vllm", "status": "ready"}
+        for model_name, status in all_models.items()
+        if status.get("status") == "running" and status.get("health") == "healthy"
+    ]
+
+    return {"object": "list", "data": models}
+
 
-    return ModelList(data=models)
+# Request parameters the vLLM backends do not accept
+_BACKEND_UNSUPPORTED_PARAMS = ("tools", "tool_choice", "parallel_tool_calls", "stream_options")
+
+# Fields of a validated request that are not dumped into the backend payload
+_VALIDATED_DUMP_EXCLUDE = {"model", "messages", *_BACKEND_UNSUPPORTED_PARAMS}
+
+# Defaults ChatCompletionRequest applies, mirrored for requests that skip validation
+_PASSTHROUGH_DEFAULTS = {"stream": False, "temperature": 1.0, "top_p": 1.0}
+
+# Message roles accepted by ChatMessage, checked before a request skips validation
+_PASSTHROUGH_ROLES = frozenset({"system", "user", "assistant", "tool"})
+
+# vLLM can calculate negative max_tokens if prompt is too long and max_tokens=None,
+# so requests without max_tokens get a default that leaves room for the prompt
+DEFAULT_MAX_TOKENS = 4096
+
+
+def _is_passthrough(data: Any) -> bool:
+    """
+    Check if a raw chat request can be forwarded to the backend without validation.
+
+    Requests without tools or streamed usage statistics need no processing
+    beyond a model name rewrite, so they skip the ChatCompletionRequest model.
+    Anything unusual falls back to the validated path, which reports errors.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("stream", False), bool) or data.get("tools"):
+        return False
+
+    stream_options = data.get("stream_options")
+    if stream_options is not None and (
+        not isinstance(stream_options, dict) or stream_options.get("include_usage")
+    ):
+        return False
+
+    messages = data.get("messages")
+    return (
+        isinstance(data.get("model"), str)
+        and isinstance(messages, list)
+        and all(isinstance(msg, dict) and msg.get("role") in _PASSTHROUGH_ROLES for msg in messages)
+    )
+
+
+def _prepare_backend_payload(payload: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    """Drop parameters the backend doesn't support and apply the max_tokens default"""
+    for param in _BACKEND_UNSUPPORTED_PARAMS:
+        payload.pop(param, None)
+
+    if payload.get("max_tokens") is None:
+        payload["max_tokens"] = DEFAULT_MAX_TOKENS
+        logger.info("[%s] max_tokens not specified, using default: %d", request_id, DEFAULT_MAX_TOKENS)
+
+    # Log payload being sent to backend (for debugging)
+    logger.info("[%s] Sending to backend - max_tokens=%s", request_id, payload.get("max_tokens"))
+    return payload
 
 
 @app.post("/v1/chat/completions")
-async def chat_completions(
-    request: ChatCompletionRequest,
-    raw_request: Request,
-    api_key: str = Depends(verify_api_key)
-):
+async def chat_completions(raw_request: Request):
     """
     Create chat completion - routes to appropriate backend based on model
     Supports both streaming and non-streaming responses
     """
-    request_id = str(uuid.uuid4())
+    request_id = new_request_id()
     client_ip = raw_request.client.host
 
+    data = await read_json_body(raw_request)
+
+    if not _is_passthrough(data):
+        try:
+            request = ChatCompletionRequest.model_validate(data)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+        return await _chat_completion(request, request_id, client_ip)
+
+    # Pass-through: forward the client's JSON with only the model rewritten
+    stream = data.get("stream", False)
     logger.info(
-        f"[{request_id}] Chat completion request - "
-        f"model={request.model}, stream={request.stream}, "
-        f"messages={len(request.messages)}, tools={len(request.tools or [])}, "
-        f"max_tokens={request.max_tokens}, "
-        f"client={client_ip}"
+        "[%s] Chat completion request - model=%s, stream=%s, messages=%d, tools=0, max_tokens=%s, client=%s",
+        request_id, data["model"], stream, len(data["messages"]), data.get("max_tokens"), client_ip
+    )
+
+    backend_url, backend_model = resolve_model(data["model"])
+    logger.info("[%s] Routing to backend: %s", request_id, backend_url)
+
+    payload = {**_PASSTHROUGH_DEFAULTS, **data}
+    payload = {key: value for key, value in payload.items() if value is not None}
+    payload["model"] = backend_model
+    # Drops null fields and flattens multi-modal content arrays the same way the validated path does
+    messages = [{key: value for key, value in msg.items() if value is not None} for msg in data["messages"]]
+    payload["messages"] = inject_tools_into_messages(messages, None)
+    _prepare_backend_payload(payload, request_id)
+
+    return await _forward_chat_completion(payload, backend_url, request_id, stream=stream)
+
+
+async def _chat_completion(
+    request: ChatCompletionRequest,
+    request_id: str,
+    client_ip: str
+):
+    """Handle a validated chat completion request, including tool calling"""
+    logger.info(
+        "[%s] Chat completion request - model=%s, stream=%s, messages=%d, tools=%d, max_tokens=%s, client=%s",
+        request_id, request.model, request.stream, len(request.messages),
+        len(request.tools or []), request.max_tokens, client_ip
     )
 
     # Route to appropriate backend
-    backend_url = get_backend_url(request.model)
-    logger.info(f"[{request_id}] Routing to backend: {backend_url}")
+    backend_url, backend_model = resolve_model(request.model)
+    logger.info("[%s] Routing to backend: %s", request_id, backend_url)
 
-    # Forward request to backend
-    backend_endpoint = f"{backend_url}/v1/chat/completions"
+    # Validate tool result messages if present (messages are only dumped when there are some)
+    if request.tools and any(msg.role == 'tool' for msg in request.messages):
+        messages_for_validation = [msg.model_dump() for msg in request.messages]
+        try:
+            validate_tool_result_messages(messages_for_validation)
+        except ValueError as e:
+            logger.error("[%s] Tool validation error: %s", request_id, e)
+            raise HTTPException(
+                status_code=400,
+                detail=create_error_response(
+                    message=str(e),
+                    error_type="invalid_request_error",
+                    code="invalid_tool_call_id"
+                )
+            )
+
+    # Transform request: inject tools into messages if tools are provided
+    messages = inject_tools_into_messages(request.messages, request.tools)
+
+    # Prepare request payload and translate model name to backend model name
+    # messages/model are replaced below and unsupported params dropped, so skip dumping them
+    payload = request.model_dump(exclude_none=True, exclude=_VALIDATED_DUMP_EXCLUDE)
+    payload["messages"] = messages
+    payload["model"] = backend_model
+    _prepare_backend_payload(payload, request_id)
 
+    return await _forward_chat_completion(
+        payload, backend_url, request_id, stream=request.stream, request=request
+    )
+
+
+# Keep proxies (e.g. nginx) from buffering token streams
+_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Keep-alive comment interval while tool detection buffers the whole generation
+SSE_PING_INTERVAL = 15  # seconds
+
+
+def _backend_error_detail(response: httpx.Response) -> Any:
+    """Backend error body as JSON when possible, otherwise as text"""
     try:
-        # Validate tool result messages if present
-        messages_for_validation = [
-            msg.model_dump() if hasattr(msg, 'model_dump') else msg
-            for msg in request.messages
-        ]
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return response.text
 
-        if request.tools and any(msg.get('role') == 'tool' for msg in messages_for_validation):
-            try:
-                validate_tool_result_messages(messages_for_validation)
-            except ValueError as e:
-                logger.error(f"[{request_id}] Tool validation error: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=create_error_response(
-                        message=str(e),
-                        error_type="invalid_request_error",
-                        code="invalid_tool_call_id"
-                    )
-                )
 
-        # Transform request: inject tools into messages if tools are provided
-        messages = inject_tools_into_messages(request.messages, request.tools)
-
-        # Prepare request payload and translate model name to backend model name
-        payload = request.model_dump(exclude_none=True)
-        payload["messages"] = messages
-        backend_model = MODEL_NAME_MAPPING.get(request.model, request.model)
-        payload["model"] = backend_model
-
-        # Remove tool-calling parameters that backend doesn't support
-        payload.pop("tools", None)
-        payload.pop("tool_choice", None)
-        payload.pop("parallel_tool_calls", None)
-        payload.pop("stream_options", None)
-
-        # Handle max_tokens: if None, set a reasonable default
-        # vLLM can calculate negative max_tokens if prompt is too long and max_tokens=None
-        if payload.get("max_tokens") is None:
-            # Set a reasonable default that leaves room for the prompt
-            default_max_tokens = 4096
-            payload["max_tokens"] = default_max_tokens
-            logger.info(f"[{request_id}] max_tokens not specified, using default: {default_max_tokens}")
-
-        # Log payload being sent to backend (for debugging)
-        logger.info(f"[{request_id}] Sending to backend - max_tokens={payload.get('max_tokens')}")
-
-        if request.stream:
-            # Streaming response with tool detection and usage stats
-            async def stream_generator():
-                async with http_client.stream(
-                    "POST",
-                    backend_endpoint,
-                    json=payload,
-                    headers={"Authorization": f"Bearer {API_KEY}"},
-                    timeout=300.0
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        logger.error(f"[{request_id}] Backend error: {error_text}")
-                        raise HTTPException(
-                            status_code=response.status_code,
-                            detail=error_text.decode()
-                        )
-
-                    # Use enhanced streaming if tools are present or usage stats requested
-                    if request.tools or (request.stream_options and request.stream_options.get("include_usage")):
-                        async for chunk in stream_with_tool_detection(
-                            response.aiter_text(),
+async def _forward_chat_completion(
+    payload: Dict[str, Any],
+    backend_url: str,
+    request_id: str,
+    stream: bool,
+    request: Optional[ChatCompletionRequest] = None
+):
+    """
+    Send a prepared chat completion payload to the backend.
+
+    Tool call detection and usage statistics apply only when the validated
+    request is given; otherwise the backend response is passed through.
+    """
+    backend_endpoint = f"{backend_url}/v1/chat/completions"
+    backend_model = payload["model"]
+    content = orjson.dumps(payload)
+
+    try:
+        if stream:
+            # Open the backend stream first so errors keep their status code
+            backend_request = http_client.build_request(
+                "POST",
+                backend_endpoint,
+                content=content,
+                headers=_BACKEND_HEADERS,
+                timeout=COMPLETION_TIMEOUT
+            )
+            response = await http_client.send(backend_request, stream=True)
+            if response.is_error:
+                await response.aread()
+                await response.aclose()
+                response.raise_for_status()
+
+            # Use enhanced streaming if tools are present or usage stats requested
+            if request and (request.tools or (request.stream_options and request.stream_options.get("include_usage"))):
+                async def event_generator():
+                    try:
+                        async for data in stream_with_tool_detection(
+                            response.aiter_lines(),
                             request,
                             backend_model
                         ):
-                            yield chunk
-                    else:
-                        # Simple passthrough for non-tool requests
-                        async for chunk in simple_stream_passthrough(response.aiter_text()):
-                            yield chunk
+                            yield data
+                    finally:
+                        await response.aclose()
+
+                # Nothing reaches the client until generation ends, so keep the connection alive.
+                # The background close covers a generator that is never iterated
+                return EventSourceResponse(
+                    event_generator(),
+                    headers=_STREAM_HEADERS,
+                    ping=SSE_PING_INTERVAL,
+                    sep="\n",
+                    background=BackgroundTask(response.aclose)
+                )
+
+            # Simple passthrough for non-tool requests: the backend's bytes are sent
+            # undecoded, straight from httpx
+            async def byte_passthrough():
+                try:
+                    async for chunk in response.aiter_bytes():
+                        yield chunk
+                finally:
+                    await response.aclose()
 
             return StreamingResponse(
-                stream_generator(),
-                media_type="text/event-stream"
+                byte_passthrough(),
+                media_type="text/event-stream",
+                headers=_STREAM_HEADERS
             )
         else:
             # Non-streaming response
             response = await http_client.post(
                 backend_endpoint,
-                json=payload,
-                headers={"Authorization": f"Bearer {API_KEY}"},
-                timeout=300.0
+                content=content,
+                headers=_BACKEND_HEADERS,
+                timeout=COMPLETION_TIMEOUT
             )
 
-            if response.status_code != 200:
-                logger.error(f"[{request_id}] Backend error: {response.text}")
-                raise HTTPException(
+            response.raise_for_status()
+            logger.info("[%s] Request completed successfully", request_id)
+
+            if not (request and request.tools):
+                # Nothing to rewrite: return the backend's JSON bytes as-is
+                return Response(
+                    content=response.content,
                     status_code=response.status_code,
-                    detail=response.json()
+                    media_type=response.headers.get("content-type", "application/json")
                 )
 
             # Transform response to inject tool_calls if detected
-            backend_response = response.json()
-            transformed_response = transform_response_with_tools(backend_response, request)
+            backend_response = orjson.loads(response.content)
+            return transform_response_with_tools(backend_response, request)
 
-            logger.info(f"[{request_id}] Request completed successfully")
-            return transformed_response
+    except httpx.HTTPStatusError as e:
+        logger.error("[%s] Backend error: %s", request_id, e.response.text)
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=_backend_error_detail(e.response)
+        )
 
     except httpx.TimeoutException:
-        logger.error(f"[{request_id}] Backend timeout")
+        logger.error("[%s] Backend timeout", request_id)
         raise HTTPException(
             status_code=504,
             detail={
@@ -644,7 +794,7 @@ async def chat_completions(
             }
         )
     except httpx.ConnectError:
-        logger.error(f"[{request_id}] Cannot connect to backend")
+        logger.error("[%s] Cannot connect to backend", request_id)
         raise HTTPException(
             status_code=503,
             detail={
@@ -659,7 +809,7 @@ async def chat_completions(
         # Re-raise HTTPException without modification (for validation errors, etc.)
         raise
     except Exception as e:
-        logger.error(f"[{request_id}] Unexpected error: {e}", exc_info=True)
+        logger.error("[%s] Unexpected error: %s", request_id, e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -676,35 +826,53 @@ async def chat_completions(
 # Legacy Completions Endpoint (optional)
 # ============================================================================
 
+def _body_validation_error(loc: Tuple, error_type: str, msg: str, value: Any) -> RequestValidationError:
+    """Validation error for a request body field, reported like a pydantic one"""
+    return RequestValidationError([{"type": error_type, "loc": ("body", *loc), "msg": msg, "input": value}])
+
+
 @app.post("/v1/completions")
-async def completions(
-    raw_request: Request,
-    api_key: str = Depends(verify_api_key)
-):
+async def completions(raw_request: Request):
     """
     Legacy completions endpoint - converts to chat format and routes
     """
-    request_data = await raw_request.json()
-    request_id = str(uuid.uuid4())
+    request_data = await read_json_body(raw_request)
+    request_id = new_request_id()
+
+    if not isinstance(request_data, dict):
+        raise _body_validation_error((), "dict_type", "Input should be a valid dictionary", request_data)
 
-    logger.info(f"[{request_id}] Legacy completion request - model={request_data.get('model')}")
+    logger.info("[%s] Legacy completion request - model=%s", request_id, request_data.get("model"))
 
     # Convert to chat format
     prompt = request_data.get("prompt", "")
     if isinstance(prompt, list):
         prompt = "\n".join(prompt)
 
-    chat_request = ChatCompletionRequest(
-        model=request_data.get("model"),
-        messages=[ChatMessage(role="user", content=prompt)],
-        stream=request_data.get("stream", False),
-        max_tokens=request_data.get("max_tokens"),
-        temperature=request_data.get("temperature", 1.0),
-        top_p=request_data.get("top_p", 1.0),
-    )
+    model = request_data.get("model")
+    if not isinstance(model, str):
+        raise _body_validation_error(("model",), "string_type", "Input should be a valid string", model)
+
+    stream = request_data.get("stream", False)
+    if not isinstance(stream, bool):
+        raise _body_validation_error(("stream",), "bool_type", "Input should be a valid boolean", stream)
+
+    backend_url, backend_model = resolve_model(model)
+    logger.info("[%s] Routing to backend: %s", request_id, backend_url)
+
+    # Build the backend chat payload directly; there are no tools to handle
+    payload = {
+        "model": backend_model,
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": stream,
+        "max_tokens": request_data.get("max_tokens"),
+        "temperature": request_data.get("temperature", _PASSTHROUGH_DEFAULTS["temperature"]),
+        "top_p": request_data.get("top_p", _PASSTHROUGH_DEFAULTS["top_p"]),
+    }
+    payload = {key: value for key, value in payload.items() if value is not None}
+    _prepare_backend_payload(payload, request_id)
 
-    # Use chat completions endpoint
-    return await chat_completions(chat_request, raw_request, api_key)
+    return await _forward_chat_completion(payload, backend_url, request_id, stream=stream)
 
 
 # ============================================================================
@@ -761,10 +929,51 @@ MODEL_METADATA = {
     },
 }
 
-async def run_docker_command(command: List[str], cwd: str = None, env: Dict[str, str] = None) -> tuple[bool, str]:
-    """Execute docker command asynchronously"""
+
+@dataclass(frozen=True, slots=True)
+class ModelSpec:
+    """Static facts about a managed model, resolved once from the tables above"""
+    name: str
+    container: str
+    profile: Optional[str]
+    hf_path: Optional[str]
+    model_dir: Optional[str]  # HuggingFace cache directory under MODELS_HUB_DIR
+    gpu_memory_gb: float
+    disk_size_gb: Optional[float]
+    description: Optional[str]
+    load_time_seconds: int
+
+
+def _build_model_spec(model_name: str, container_name: str) -> ModelSpec:
+    metadata = MODEL_METADATA.get(model_name, {})
+    hf_path = metadata.get("hf_path")
+    return ModelSpec(
+        name=model_name,
+        container=container_name,
+        profile=CONTAINER_PROFILES.get(container_name),
+        hf_path=hf_path,
+        model_dir=os.path.join(MODELS_HUB_DIR, f"models--{hf_path.replace('/', '--')}") if hf_path else None,
+        gpu_memory_gb=metadata.get("gpu_memory_gb", 0),
+        disk_size_gb=metadata.get("disk_size_gb"),
+        description=metadata.get("description"),
+        load_time_seconds=metadata.get("load_time_seconds", 60),
+    )
+
+
+MODELS: Dict[str, ModelSpec] = {
+    model_name: _build_model_spec(model_name, container_name)
+    for model_name, container_name in CONTAINER_NAMES.items()
+}
+MODELS_BY_CONTAINER: Dict[str, ModelSpec] = {spec.container: spec for spec in MODELS.values()}
+
+# Bounds concurrent docker CLI processes (compose, nvidia-smi exec) under bursty polling
+_docker_cli_semaphore = asyncio.Semaphore(settings.docker_max_concurrency)
+
+
+async def run_command(command: List[str], cwd: str = None, env: Dict[str, str] = None) -> tuple[bool, str]:
+    """Execute a command asynchronously, returning (success, stdout or stderr)"""
     try:
-        logger.info(f"Executing docker command: {' '.join(command)}" + (f" (cwd={cwd})" if cwd else "") + (f" (env={env})" if env else ""))
+        logger.info(f"Executing command: {' '.join(command)}" + (f" (cwd={cwd})" if cwd else "") + (f" (env={env})" if env else ""))
 
         # Merge custom env with current environment
         process_env = os.environ.copy()
@@ -784,49 +993,57 @@ async def run_docker_command(command: List[str], cwd: str = None, env: Dict[str,
         output = stdout.decode() if success else stderr.decode()
         return success, output
     except Exception as e:
-        logger.error(f"Docker command failed: {e}")
+        logger.error(f"Command failed: {e}")
         return False, str(e)
 
 
-async def check_model_downloaded(hf_path: str) -> Dict[str, Any]:
+async def run_docker_command(command: List[str], cwd: str = None, env: Dict[str, str] = None) -> tuple[bool, str]:
+    """Execute docker command asynchronously (at most docker_max_concurrency at a time)"""
+    async with _docker_cli_semaphore:
+        return await run_command(command, cwd=cwd, env=env)
+
+
+# docker compose invocation shared by auto-start and start_model
+_COMPOSE_BASE = ("docker", "compose", "-f", DOCKER_COMPOSE_FILE, "-p", "local-llm-service")
+# Run from the project directory so relative paths in docker-compose.yml work
+COMPOSE_PROJECT_DIR = os.path.dirname(DOCKER_COMPOSE_FILE)
+# Set PWD to host project directory so ${PWD} in docker-compose.yml resolves correctly
+_COMPOSE_ENV = {"PWD": HOST_PROJECT_DIR}
+
+
+def compose_cmd(profile: Optional[str], *args: str) -> List[str]:
+    """docker compose command line, enabling the service's profile if it has one"""
+    return [*_COMPOSE_BASE, *(("--profile", profile) if profile else ()), *args]
+
+
+async def run_compose_command(profile: Optional[str], *args: str) -> tuple[bool, str]:
+    """Run a docker compose command for the project"""
+    return await run_docker_command(compose_cmd(profile, *args), cwd=COMPOSE_PROJECT_DIR, env=_COMPOSE_ENV)
+
+
+# Container and download state are cached briefly so status polling from
+# several clients does not repeat the same docker commands
+CONTAINER_STATUS_TTL = 3.0  # seconds
+
+
+@async_ttl_cache(ttl=CONTAINER_STATUS_TTL)
+async def check_model_downloaded(model_name: str) -> Dict[str, Any]:
     """Check if a HuggingFace model is fully downloaded"""
     # Check in the models/hub directory where HuggingFace caches models
-    model_dir = f"/models/hub/models--{hf_path.replace('/', '--')}"
-    success, output = await run_docker_command([
-        "docker", "exec", "vllm-router", "sh", "-c", f"[ -d '{model_dir}' ] && echo 'true' || echo 'false'"
-    ])
+    # (mounted into the router, so the checks run on the local filesystem)
+    model_dir = MODELS[model_name].model_dir
 
-    if output.strip() != "true":
+    if not os.path.isdir(model_dir):
         return {"downloaded": False, "downloading": False, "size": None}
 
     # Check if download is complete by looking at .no_exist directory
     # Only check for essential files - ignore optional ones like preprocessor_config.json, video_preprocessor_config.json, etc.
-    success, no_exist_files = await run_docker_command([
-        "docker", "exec", "vllm-router", "sh", "-c",
-        f"find '{model_dir}/.no_exist' -type f -name '*.safetensors' -o -name 'config.json' 2>/dev/null"
-    ])
-
-    is_downloading = False
-    is_fully_downloaded = False
-
-    if success:
-        # Only consider model as incomplete if essential files (weights, config) are missing
-        has_essential_missing = bool(no_exist_files.strip())
-        if has_essential_missing:
-            is_downloading = True  # Essential files still downloading
-            is_fully_downloaded = False
-        else:
-            is_downloading = False
-            is_fully_downloaded = True  # Essential files complete (optional files don't matter)
-    else:
-        # If .no_exist doesn't exist at all, assume download is complete
-        is_fully_downloaded = True
+    # If .no_exist doesn't exist at all, the download is complete
+    is_downloading = await asyncio.to_thread(_has_missing_essential_files, model_dir)
+    is_fully_downloaded = not is_downloading
 
-    # Get directory size
-    success, size_output = await run_docker_command([
-        "docker", "exec", "vllm-router", "du", "-sh", model_dir
-    ])
-    size_str = size_output.split()[0] if success and size_output else None
+    # Get directory size (walk skipped while the model's files are unchanged)
+    size_str = await get_dir_size(model_dir, complete=is_fully_downloaded)
 
     return {
         "downloaded": is_fully_downloaded,
@@ -835,49 +1052,110 @@ async def check_model_downloaded(hf_path: str) -> Dict[str, Any]:
     }
 
 
+# Directory sizes keyed by path -> (mtime, computed_at, size). Files still being
+# downloaded grow without touching directory mtimes, so in-progress sizes also expire.
+DIR_SIZE_TTL = 10.0  # seconds, for directories that are still changing
+_dir_size_cache: Dict[str, Tuple[float, float, str]] = {}
+
+
+async def get_dir_size(path: str, complete: bool = False) -> Optional[str]:
+    """
+    Human-readable size of a directory tree, formatted like ``du -sh``.
+
+    The result is reused while the directory and its HuggingFace ``blobs``
+    subdirectory are unmodified: indefinitely for ``complete`` trees, and
+    for DIR_SIZE_TTL seconds otherwise.
+    """
+    try:
+        mtime = max(os.stat(p).st_mtime for p in (path, os.path.join(path, "blobs")) if os.path.exists(p))
+    except (OSError, ValueError):
+        return None
+
+    now = time.monotonic()
+    cached = _dir_size_cache.get(path)
+    if cached and cached[0] == mtime and (complete or now - cached[1] < DIR_SIZE_TTL):
+        return cached[2]
+
+    try:
+        size = _format_size(await asyncio.to_thread(_dir_size_bytes, path))
+    except OSError as e:
+        logger.warning("Could not compute size of %s: %s", path, e)
+        return None
+
+    _dir_size_cache[path] = (mtime, now, size)
+    return size
+
+
+def _dir_size_bytes(path: str) -> int:
+    """Total size of regular files under path; symlinks are not followed (like du)"""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _dir_size_bytes(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count the way ``du -h`` does, e.g. 512, 8.0K, 4.2G, 183G"""
+    size = float(num_bytes)
+    unit = ""
+    for next_unit in ("K", "M", "G", "T", "P"):
+        if size < 1024:
+            break
+        size /= 1024
+        unit = next_unit
+    if not unit:
+        return str(num_bytes)
+    if size < 10:
+        return f"{math.ceil(size * 10) / 10:.1f}{unit}"
+    return f"{math.ceil(size)}{unit}"
+
+
+def _has_missing_essential_files(model_dir: str) -> bool:
+    """True if HuggingFace recorded weights or config.json as not yet available"""
+    for _, _, files in os.walk(os.path.join(model_dir, ".no_exist")):
+        if any(name == "config.json" or name.endswith(".safetensors") for name in files):
+            return True
+    return False
+
+
+def _gpu_memory_summary(used_mb: int, total_mb: int) -> dict:
+    """GPU memory figures in the shape the status endpoints report"""
+    return {
+        "used_mb": used_mb,
+        "total_mb": total_mb,
+        "available_mb": total_mb - used_mb,
+        "used_gb": round(used_mb / 1024, 2),
+        "total_gb": round(total_mb / 1024, 2),
+        "available_gb": round((total_mb - used_mb) / 1024, 2)
+    }
+
+
 async def get_gpu_memory_info() -> dict:
-    """Get current GPU memory usage using nvidia-smi"""
+    """Get current GPU memory usage via NVML, falling back to nvidia-smi"""
+    # NVML answers in-process in well under a millisecond
+    memory = read_gpu_memory_mb()
+    if memory is not None:
+        return _gpu_memory_summary(*memory)
+
+    query = ["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"]
     try:
-        # Try to exec nvidia-smi from running GPU containers first
-        gpu_containers = ["vllm-gpt-oss-120b", "vllm-coder", "vllm-general", "vllm-gpt-oss-20b"]
-
-        for container in gpu_containers:
-            success, output = await run_docker_command([
-                "docker", "exec", container, "nvidia-smi",
-                "--query-gpu=memory.used,memory.total",
-                "--format=csv,noheader,nounits"
-            ])
-
-            if success and output.strip():
-                used, total = output.strip().split(", ")
-                return {
-                    "used_mb": int(used),
-                    "total_mb": int(total),
-                    "available_mb": int(total) - int(used),
-                    "used_gb": round(int(used) / 1024, 2),
-                    "total_gb": round(int(total) / 1024, 2),
-                    "available_gb": round((int(total) - int(used)) / 1024, 2)
-                }
+        # The router's "utility" GPU reservation mounts nvidia-smi into this container
+        success, output = await run_command(query)
 
-        # If no containers are running, use a temporary container
-        logger.info("No running GPU containers found, using temporary container for GPU memory check")
-        success, output = await run_docker_command([
-            "docker", "run", "--rm", "--gpus", "all",
-            "nvidia/cuda:12.1.0-base-ubuntu22.04",
-            "nvidia-smi", "--query-gpu=memory.used,memory.total",
-            "--format=csv,noheader,nounits"
-        ])
+        # Otherwise exec it inside whichever GPU container is running
+        if not (success and output.strip()):
+            for container in ["vllm-gpt-oss-120b", "vllm-coder", "vllm-general", "vllm-gpt-oss-20b"]:
+                success, output = await run_docker_command(["docker", "exec", container, *query])
+                if success and output.strip():
+                    break
 
         if success and output.strip():
             used, total = output.strip().split(", ")
-            return {
-                "used_mb": int(used),
-                "total_mb": int(total),
-                "available_mb": int(total) - int(used),
-                "used_gb": round(int(used) / 1024, 2),
-                "total_gb": round(int(total) / 1024, 2),
-                "available_gb": round((int(total) - int(used)) / 1024, 2)
-            }
+            return _gpu_memory_summary(int(used), int(total))
     except Exception as e:
         logger.error(f"Failed to get GPU memory: {e}")
     return {"used_gb": 0, "total_gb": 0, "available_gb": 0}
@@ -886,11 +1164,19 @@ async def get_gpu_memory_info() -> dict:
 async def get_container_gpu_memory(container_name: str) -> float:
     """Get GPU memory used by a specific container in GB"""
     try:
+        # NVML reports memory per host PID; Docker lists the container's host PIDs
+        process_memory = read_process_gpu_memory_mb()
+        if process_memory:
+            pids = await docker_client.container_pids(container_name)
+            used_mb = sum(process_memory.get(pid, 0) for pid in pids or ())
+            if used_mb:
+                return round(used_mb / 1024, 1)
+
+        # The router doesn't share the host PID namespace, so NVML usually can't
+        # see other containers' processes: read nvidia-smi inside the container.
         # Check container is running
-        success, status = await run_docker_command([
-            "docker", "inspect", "--format", "{{.State.Status}}", container_name
-        ])
-        if not success or status.strip() != "running":
+        info = await docker_client.inspect_container(container_name)
+        if not info or info["State"]["Status"] != "running":
             return 0.0
 
         # Get GPU memory from container
@@ -907,54 +1193,95 @@ async def get_container_gpu_memory(container_name: str) -> float:
     return 0.0
 
 
-async def get_container_status(container_name: str) -> Dict[str, Any]:
-    """Get status of a Docker container"""
-    from datetime import datetime
+async def list_running_containers() -> Set[str]:
+    """Names of all running containers, from a single Docker API call"""
+    return {
+        name.lstrip("/")
+        for container in await docker_client.list_containers()
+        for name in container.get("Names", [])
+    }
 
-    # Get container state
-    success, output = await run_docker_command([
-        "docker", "inspect", "--format", "{{.State.Status}}", container_name
-    ])
 
-    if not success:
+# Exited containers' logs don't change until the next run, so the classification
+# is kept per container and keyed on State.FinishedAt: name -> (finished_at, kind)
+_exit_failure_cache: Dict[str, Tuple[str, str]] = {}
+
+# Log markers used to classify failures, each scanned in a single pass
+_GPU_MEMORY_ERROR_RE = re.compile(
+    "Free memory|GPU memory utilization|gpu_memory_utilization|OutOfMemory|CUDA out of memory"
+)
+_ENGINE_FAILURE_RE = re.compile("Engine core initialization failed|RuntimeError")
+_GPU_HINT_RE = re.compile("CUDA|GPU|(?i:memory)")
+
+
+async def get_exit_failure_kind(container_name: str, finished_at: str) -> Optional[str]:
+    """
+    Classify why an exited container failed from its last 100 log lines.
+
+    Returns "gpu_memory", "engine_init" or "other", or None if the logs
+    could not be read. Logs are fetched once per container run.
+    """
+    cached = _exit_failure_cache.get(container_name)
+    if cached and cached[0] == finished_at:
+        return cached[1]
+
+    logs = await docker_client.container_logs(container_name, tail=100)
+    if logs is None:
+        return None
+
+    if _GPU_MEMORY_ERROR_RE.search(logs):
+        kind = "gpu_memory"
+    elif "Engine core initialization failed" in logs and "RuntimeError" in logs:
+        kind = "engine_init"
+    else:
+        kind = "other"
+
+    _exit_failure_cache[container_name] = (finished_at, kind)
+    return kind
+
+
+@lru_cache(maxsize=64)
+def _parse_docker_timestamp(timestamp: str) -> float:
+    """Epoch seconds for a Docker RFC 3339 timestamp (parsed once per container start)"""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+
+@async_ttl_cache(ttl=CONTAINER_STATUS_TTL)
+async def get_container_status(container_name: str) -> Dict[str, Any]:
+    """Get status of a Docker container (cached; copy before modifying)"""
+    # Get container state; one inspect call covers status, start time, health and exit code
+    info = await docker_client.inspect_container(container_name)
+
+    if info is None:
         return {"status": "not_found", "container": container_name, "ever_started": False}
 
-    status = output.strip()
+    state = info.get("State", {})
+    status = state.get("Status", "")
     result = {"status": status, "container": container_name}
 
     # Check if container has ever been started (StartedAt != 0001-01-01)
-    success, started_at_str = await run_docker_command([
-        "docker", "inspect", "--format", "{{.State.StartedAt}}", container_name
-    ])
-    ever_started = False
-    if success and started_at_str.strip() and not started_at_str.startswith("0001-01-01"):
-        ever_started = True
-    result["ever_started"] = ever_started
+    started_at_str = state.get("StartedAt", "")
+    result["ever_started"] = bool(started_at_str) and not started_at_str.startswith("0001-01-01")
 
     # If starting/restarting, check if it's loading
     if status == "running":
         # Check if container just started (less than 60 seconds ago)
-        if success and started_at_str:
+        if started_at_str:
             try:
-                started_at = datetime.fromisoformat(started_at_str.strip().replace('Z', '+00:00'))
-                uptime_seconds = (datetime.now(started_at.tzinfo) - started_at).total_seconds()
+                uptime_seconds = time.time() - _parse_docker_timestamp(started_at_str)
                 if uptime_seconds < 60:
                     result["status"] = "loading"
                 # If running for > 90 seconds but health check still failing, check for errors
                 elif uptime_seconds > 90:
                     # Get health status
-                    health_success, health_status = await run_docker_command([
-                        "docker", "inspect", "--format", "{{.State.Health.Status}}", container_name
-                    ])
-                    if health_success and health_status.strip() == "starting":
+                    health_status = (state.get("Health") or {}).get("Status")
+                    if health_status == "starting":
                         # Still in starting state after 90s - check logs for errors
-                        log_success, logs = await run_docker_command([
-                            "docker", "logs", "--tail", "100", container_name
-                        ])
-                        if log_success:
-                            if "Engine core initialization failed" in logs or "RuntimeError" in logs:
+                        logs = await docker_client.container_logs(container_name, tail=100)
+                        if logs is not None:
+                            if _ENGINE_FAILURE_RE.search(logs):
                                 # Check if it's a GPU memory issue
-                                if "CUDA" in logs or "GPU" in logs or "memory" in logs.lower():
+                                if _GPU_HINT_RE.search(logs):
                                     result["status"] = "insufficient_gpu_ram"
                                     result["error"] = "Insufficient GPU memory - container stuck in starting state"
                                 else:
@@ -966,29 +1293,21 @@ async def get_container_status(container_name: str) -> Dict[str, Any]:
     # Check for exited/stopped state
     if status == "exited":
         # Check exit code for failure
-        success, exit_code = await run_docker_command([
-            "docker", "inspect", "--format", "{{.State.ExitCode}}", container_name
-        ])
-        if success and exit_code.strip() != "0":
+        exit_code = str(state.get("ExitCode", 0))
+        if exit_code != "0":
             # Check logs for GPU memory error
-            log_success, logs = await run_docker_command([
-                "docker", "logs", "--tail", "100", container_name
-            ])
-            if log_success:
+            failure = await get_exit_failure_kind(container_name, state.get("FinishedAt", ""))
+            if failure is not None:
                 # Check for explicit GPU memory errors
-                if ("Free memory" in logs or "GPU memory utilization" in logs or "gpu_memory_utilization" in logs or
-                    "OutOfMemory" in logs or "CUDA out of memory" in logs):
+                if failure == "gpu_memory":
                     result["status"] = "insufficient_gpu_ram"
                     result["error"] = "Insufficient GPU memory available"
                 # Check for Engine initialization failures (often GPU memory related)
-                elif "Engine core initialization failed" in logs and "RuntimeError" in logs:
+                elif failure == "engine_init":
                     # This is likely a GPU memory issue - check if there's enough free memory
                     gpu_info = await get_gpu_memory_info()
-                    model_metadata = MODEL_METADATA.get(
-                        next((k for k, v in CONTAINER_NAMES.items() if v == container_name), None),
-                        {}
-                    )
-                    required_gb = model_metadata.get("gpu_memory_gb", 0)
+                    spec = MODELS_BY_CONTAINER.get(container_name)
+                    required_gb = spec.gpu_memory_gb if spec else 0
                     if required_gb > gpu_info.get("available_gb", 0) + 5:  # +5GB buffer for overhead
                         result["status"] = "insufficient_gpu_ram"
                         result["error"] = f"Engine initialization failed - likely insufficient GPU memory (need {required_gb}GB, have {gpu_info.get('available_gb', 0):.1f}GB available)"
@@ -999,59 +1318,73 @@ async def get_container_status(container_name: str) -> Dict[str, Any]:
                     result["status"] = "failed"
             else:
                 result["status"] = "failed"
-            result["exit_code"] = exit_code.strip()
+            result["exit_code"] = exit_code
 
     return result
 
 
-@app.get("/v1/models/status")
-async def get_models_status(api_key: str = Depends(verify_api_key)):
-    """Get status of all model backends with download info and GPU memory"""
-    statuses = {}
+# The combined status is polled by the web UI; cache it briefly on top of the per-probe caches
+MODEL_STATUSES_TTL = 2.0  # seconds
 
-    # Get GPU memory info
-    gpu_info = await get_gpu_memory_info()
 
-    for model_name, container_name in CONTAINER_NAMES.items():
-        container_status = await get_container_status(container_name)
+@async_ttl_cache(ttl=MODEL_STATUSES_TTL)
+async def collect_model_statuses() -> Dict[str, Any]:
+    """Collect status of all model backends with download info and GPU memory (cached; read-only)"""
+    async def _collect(spec: ModelSpec) -> Dict[str, Any]:
+        model_name, container_name = spec.name, spec.container
+        container_status = dict(await get_container_status(container_name))
+
+        # A running or loading container has its files, so only its (cached) size is needed
+        download_info = None
+        if spec.model_dir:
+            if container_status["status"] in ("running", "loading"):
+                download_info = {"size": await get_dir_size(spec.model_dir, complete=True)}
+            else:
+                download_info = await check_model_downloaded(model_name)
 
         # Add model metadata
-        metadata = MODEL_METADATA.get(model_name, {})
-        container_status["size_gb"] = metadata.get("disk_size_gb")  # For display purposes
-        container_status["gpu_memory_gb"] = metadata.get("gpu_memory_gb")  # Actual GPU memory requirement
-        container_status["description"] = metadata.get("description")
-        container_status["estimated_load_time_seconds"] = metadata.get("load_time_seconds", 60)
-
-        # If running, show actual GPU memory usage
-        # Note: We don't show live progress during loading because nvidia-smi reports
-        # total GPU memory, not per-container memory, which gives misleading values
-        if container_status["status"] == "running":
-            # Get current GPU memory used by this container
-            current_gpu_memory = await get_container_gpu_memory(container_name)
-            container_status["gpu_memory_used_gb"] = current_gpu_memory
+        container_status["size_gb"] = spec.disk_size_gb  # For display purposes
+        container_status["gpu_memory_gb"] = spec.gpu_memory_gb  # Actual GPU memory requirement
+        container_status["description"] = spec.description
+        container_status["estimated_load_time_seconds"] = spec.load_time_seconds
 
         # Check if model is downloaded
         # Logic:
         # 1. If container is running or loading → model MUST be downloaded
         # 2. If container has EVER started → model MUST be downloaded (can't run without files)
         # 3. Get model size info if available
-        hf_path = metadata.get("hf_path")
-        if hf_path:
-            download_info = await check_model_downloaded(hf_path)
+        if download_info is not None:
             container_status["downloaded_size"] = download_info["size"]
 
-        # Check backend health if running (but not loading)
         if container_status["status"] == "running":
+            # If running, show actual GPU memory usage and check backend health
+            # Note: We don't show live progress during loading because nvidia-smi reports
+            # total GPU memory, not per-container memory, which gives misleading values
             backend_url = MODEL_ROUTING.get(model_name)
             if backend_url:
-                health = await check_backend_health(backend_url)
+                current_gpu_memory, health = await asyncio.gather(
+                    get_container_gpu_memory(container_name),
+                    check_backend_health(backend_url)
+                )
+            else:
+                current_gpu_memory, health = await get_container_gpu_memory(container_name), None
+            container_status["gpu_memory_used_gb"] = current_gpu_memory
+
+            if health is not None:
                 container_status["health"] = health.get("status", "unknown")
 
                 # If health check fails, might still be loading
                 if container_status["health"] != "healthy":
                     container_status["status"] = "loading"
 
-        statuses[model_name] = container_status
+        return container_status
+
+    # GPU memory info and every model's status are gathered concurrently
+    gpu_info, *model_statuses = await asyncio.gather(
+        get_gpu_memory_info(),
+        *(_collect(spec) for spec in MODELS.values())
+    )
+    statuses = dict(zip(MODELS, model_statuses))
 
     # Add proactive GPU memory warnings for stopped models
     for model_name, status in statuses.items():
@@ -1088,22 +1421,27 @@ async def get_models_status(api_key: str = Depends(verify_api_key)):
     }
 
 
+@app.get("/v1/models/status")
+async def get_models_status():
+    """Get status of all model backends with download info and GPU memory"""
+    return await collect_model_statuses()
+
+
 @app.post("/v1/models/{model_name}/start")
-async def start_model(model_name: str, api_key: str = Depends(verify_api_key)):
+async def start_model(model_name: str):
     """Start a model backend container"""
-    if model_name not in CONTAINER_NAMES:
+    if model_name not in MODELS:
         raise HTTPException(
             status_code=404,
-            detail=f"Model '{model_name}' not found. Available: {list(CONTAINER_NAMES.keys())}"
+            detail=f"Model '{model_name}' not found. Available: {list(MODELS)}"
         )
 
-    container_name = CONTAINER_NAMES[model_name]
+    spec = MODELS[model_name]
+    container_name = spec.container
 
     # Check if model is fully downloaded
-    metadata = MODEL_METADATA.get(model_name, {})
-    hf_path = metadata.get("hf_path")
-    if hf_path:
-        download_info = await check_model_downloaded(hf_path)
+    if spec.model_dir:
+        download_info = await check_model_downloaded(model_name)
         if download_info["downloading"]:
             raise HTTPException(
                 status_code=400,
@@ -1120,32 +1458,18 @@ async def start_model(model_name: str, api_key: str = Depends(verify_api_key)):
     if status["status"] == "running":
         return {"message": f"Model '{model_name}' is already running", "status": "running"}
 
-    # Get profile for this container (if any)
-    profile = CONTAINER_PROFILES.get(container_name)
-    # Use project directory as working directory so relative paths in docker-compose.yml work
-    project_dir = os.path.dirname(DOCKER_COMPOSE_FILE)
-    compose_cmd_base = ["docker", "compose", "-f", DOCKER_COMPOSE_FILE, "-p", "local-llm-service"]
-    if profile:
-        compose_cmd_base.extend(["--profile", profile])
-
-    # Set PWD to host project directory so ${PWD} in docker-compose.yml resolves correctly
-    compose_env = {"PWD": HOST_PROJECT_DIR}
-
-    # If container is in failed state, remove it and recreate using docker-compose
-    if status["status"] in ["failed", "insufficient_gpu_ram"]:
-        logger.info(f"Removing failed container '{container_name}' to clear error state")
-        await run_docker_command(["docker", "rm", "-f", container_name])
-        # Use docker-compose to recreate and start
-        logger.info(f"Starting model '{model_name}' (container: {container_name})")
-        success, output = await run_docker_command(compose_cmd_base + ["up", "-d", container_name], cwd=project_dir, env=compose_env)
-    elif status["status"] == "exited":
+    logger.info(f"Starting model '{model_name}' (container: {container_name})")
+    if status["status"] == "exited":
         # Just restart if it was cleanly stopped
-        logger.info(f"Starting model '{model_name}' (container: {container_name})")
-        success, output = await run_docker_command(["docker", "start", container_name])
+        success, output = await docker_client.start_container(container_name)
     else:
-        # Container doesn't exist, use docker-compose to create and start
-        logger.info(f"Starting model '{model_name}' (container: {container_name})")
-        success, output = await run_docker_command(compose_cmd_base + ["up", "-d", container_name], cwd=project_dir, env=compose_env)
+        # Create a missing container, or recreate a failed one to clear its error state
+        up_args = ["up", "-d", container_name]
+        if status["status"] in ["failed", "insufficient_gpu_ram"]:
+            up_args.insert(2, "--force-recreate")
+        success, output = await run_compose_command(spec.profile, *up_args)
+    get_container_status.invalidate(container_name)
+    collect_model_statuses.invalidate()
 
     if not success:
         raise HTTPException(
@@ -1161,15 +1485,15 @@ async def start_model(model_name: str, api_key: str = Depends(verify_api_key)):
 
 
 @app.post("/v1/models/{model_name}/stop")
-async def stop_model(model_name: str, api_key: str = Depends(verify_api_key)):
+async def stop_model(model_name: str):
     """Stop a model backend container"""
-    if model_name not in CONTAINER_NAMES:
+    if model_name not in MODELS:
         raise HTTPException(
             status_code=404,
-            detail=f"Model '{model_name}' not found. Available: {list(CONTAINER_NAMES.keys())}"
+            detail=f"Model '{model_name}' not found. Available: {list(MODELS)}"
         )
 
-    container_name = CONTAINER_NAMES[model_name]
+    container_name = MODELS[model_name].container
 
     # Check current status
     status = await get_container_status(container_name)
@@ -1178,7 +1502,9 @@ async def stop_model(model_name: str, api_key: str = Depends(verify_api_key)):
 
     # Stop the container
     logger.info(f"Stopping model '{model_name}' (container: {container_name})")
-    success, output = await run_docker_command(["docker", "stop", container_name])
+    success, output = await docker_client.stop_container(container_name)
+    get_container_status.invalidate(container_name)
+    collect_model_statuses.invalidate()
 
     if not success:
         raise HTTPException(
@@ -1194,18 +1520,20 @@ async def stop_model(model_name: str, api_key: str = Depends(verify_api_key)):
 
 
 @app.post("/v1/models/{model_name}/restart")
-async def restart_model(model_name: str, api_key: str = Depends(verify_api_key)):
+async def restart_model(model_name: str):
     """Restart a model backend container"""
-    if model_name not in CONTAINER_NAMES:
+    if model_name not in MODELS:
         raise HTTPException(
             status_code=404,
-            detail=f"Model '{model_name}' not found. Available: {list(CONTAINER_NAMES.keys())}"
+            detail=f"Model '{model_name}' not found. Available: {list(MODELS)}"
         )
 
-    container_name = CONTAINER_NAMES[model_name]
+    container_name = MODELS[model_name].container
 
     logger.info(f"Restarting model '{model_name}' (container: {container_name})")
-    success, output = await run_docker_command(["docker", "restart", container_name])
+    success, output = await docker_client.restart_container(container_name)
+    get_container_status.invalidate(container_name)
+    collect_model_statuses.invalidate()
 
     if not success:
         raise HTTPException(
@@ -1220,11 +1548,28 @@ async def restart_model(model_name: str, api_key: str = Depends(verify_api_key))
     }
 
 
+# How long switch_model waits for unloaded models to release GPU memory
+GPU_RELEASE_TIMEOUT = 30.0  # seconds
+# Polls start fast (memory is often free right after the stop) and back off
+GPU_RELEASE_POLL_INITIAL = 0.2  # seconds
+GPU_RELEASE_POLL_MAX = 3.0  # seconds
+
+
+async def wait_for_gpu_memory(required_gb: float, timeout: float = GPU_RELEASE_TIMEOUT) -> float:
+    """Poll free GPU memory until required_gb is available or timeout passes; returns the last reading"""
+    logger.info("Waiting for GPU memory to be released...")
+    deadline = time.monotonic() + timeout
+    delay = GPU_RELEASE_POLL_INITIAL
+    while True:
+        available_gb = (await get_gpu_memory_info())["available_gb"]
+        if available_gb >= required_gb or time.monotonic() >= deadline:
+            return available_gb
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, GPU_RELEASE_POLL_MAX)
+
+
 @app.post("/v1/models/switch")
-async def switch_model(
-    target_model: str,
-    api_key: str = Depends(verify_api_key)
-):
+async def switch_model(target_model: str):
     """
     Smart model switching with automatic memory management.
 
@@ -1237,14 +1582,15 @@ async def switch_model(
     """
 
     # Validate model exists
-    if target_model not in CONTAINER_NAMES:
+    if target_model not in MODELS:
         raise HTTPException(
             status_code=404,
-            detail=f"Model '{target_model}' not found. Available: {list(CONTAINER_NAMES.keys())}"
+            detail=f"Model '{target_model}' not found. Available: {list(MODELS)}"
         )
 
     # Step 1: Check if already running
-    container_name = CONTAINER_NAMES[target_model]
+    spec = MODELS[target_model]
+    container_name = spec.container
     status = await get_container_status(container_name)
 
     if status["status"] == "running":
@@ -1260,8 +1606,7 @@ async def switch_model(
                 }
 
     # Step 2: Get memory requirements
-    metadata = MODEL_METADATA.get(target_model, {})
-    required_memory_gb = metadata.get("gpu_memory_gb", 0)  # Actual GPU memory needed
+    required_memory_gb = spec.gpu_memory_gb  # Actual GPU memory needed
 
     # Step 3: Check available memory
     gpu_info = await get_gpu_memory_info()
@@ -1276,41 +1621,35 @@ async def switch_model(
     unloaded_models = []
     if available_gb < required_memory_gb:
         # Get all running models
-        all_statuses = await get_models_status(api_key)
+        # (including ones still loading, which already hold GPU memory)
+        running_containers = await list_running_containers()
         running_models = []
 
-        for model_name, model_status in all_statuses["models"].items():
-            if model_name != target_model and model_status["status"] == "running":
-                model_metadata = MODEL_METADATA.get(model_name, {})
-                gpu_memory_gb = model_metadata.get("gpu_memory_gb", 0)
+        for other in MODELS.values():
+            if other.name != target_model and other.container in running_containers:
                 running_models.append({
-                    "name": model_name,
-                    "gpu_memory_gb": gpu_memory_gb
+                    "name": other.name,
+                    "gpu_memory_gb": other.gpu_memory_gb
                 })
 
         # Sort by GPU memory (largest first) for efficient unloading
         running_models.sort(key=lambda m: m["gpu_memory_gb"], reverse=True)
 
-        # Unload models until we have enough memory
+        # Pick models to unload until we would have enough memory
         freed_memory = 0
         for model in running_models:
             if available_gb + freed_memory >= required_memory_gb:
                 break
-
-            # Stop this model
             logger.info(f"Unloading {model['name']} ({model['gpu_memory_gb']}GB GPU) to free memory")
-            await stop_model(model["name"], api_key)
             unloaded_models.append(model["name"])
             freed_memory += model["gpu_memory_gb"]
 
-            # Wait for container to stop and GPU memory to be fully released
-            # Increased to 15 seconds to avoid memory profiling errors during model switch
-            logger.info("Waiting for GPU memory to be released...")
-            await asyncio.sleep(15)
+        # Containers release GPU memory independently, so stop them together
+        await asyncio.gather(*(stop_model(name) for name in unloaded_models))
 
-        # Refresh GPU memory info after stopping models
-        gpu_info_after = await get_gpu_memory_info()
-        total_available = gpu_info_after["available_gb"]
+        # Wait for GPU memory to actually be released before starting the new model,
+        # otherwise vLLM's memory profiling at startup can fail
+        total_available = await wait_for_gpu_memory(required_memory_gb) if unloaded_models else available_gb
 
         logger.info(f"After unloading: Available GPU memory: {total_available:.1f}GB")
 
@@ -1331,14 +1670,14 @@ async def switch_model(
 
     # Step 5: Start target model
     logger.info(f"Starting {target_model}...")
-    start_result = await start_model(target_model, api_key)
+    start_result = await start_model(target_model)
 
     return {
         "status": "success",
         "model": target_model,
         "unloaded_models": unloaded_models,
         "start_result": start_result,
-        "estimated_load_time_seconds": metadata.get("load_time_seconds", 60),
+        "estimated_load_time_seconds": spec.load_time_seconds,
         "memory_info": {
             "required_gb": round(required_memory_gb, 1),
             "available_before_gb": round(available_gb, 1),
@@ -1349,4 +1688,8 @@ async def switch_model(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop event loop and httptools parser (both shipped with uvicorn[standard])
+    uvicorn.run(
+        "app.main:app", host="0.0.0.0", port=8080, loop="uvloop", http="httptools",
+        workers=settings.router_workers
+    )
@@ -0,0 +1,118 @@
+"""
+Pure ASGI middleware for the router service
+Avoids Starlette's BaseHTTPMiddleware, which adds an extra task and
+Request/Response objects to every request
+"""
+import logging
+import secrets
+
+import orjson
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class _EventStreamAwareGZipResponder(GZipResponder):
+    """GZipResponder that leaves Server-Sent Events uncompressed"""
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith("text/event-stream"):
+                # Reuse the responder's pass-through path for already-encoded bodies
+                self.content_encoding_set = True
+
+
+class EventStreamAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip compression for regular responses that never touches SSE streams.
+
+    Starlette's GZipResponder compresses streaming bodies too, and the gzip
+    buffer would hold back streamed tokens until enough data accumulates.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = _EventStreamAwareGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Error bodies match what HTTPBearer / HTTPException produced before
+_NOT_AUTHENTICATED_BODY = orjson.dumps({"detail": "Not authenticated"})
+_INVALID_CREDENTIALS_BODY = orjson.dumps({"detail": "Invalid authentication credentials"})
+_INVALID_API_KEY_BODY = orjson.dumps({
+    "detail": {
+        "error": {
+            "message": "Invalid API key provided",
+            "type": "invalid_request_error",
+            "code": "invalid_api_key"
+        }
+    }
+})
+
+
+class AuthMiddleware:
+    """
+    Bearer token authentication for the /v1 API.
+
+    Replaces a per-endpoint FastAPI dependency: the Authorization header is
+    checked straight from the ASGI scope, so authenticated requests skip the
+    dependency-injection machinery entirely.
+    """
+
+    def __init__(self, app: ASGIApp, api_key: str, public_paths: frozenset = frozenset()) -> None:
+        self.app = app
+        self.api_key = api_key.encode()
+        self.public_paths = public_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not scope["path"].startswith("/v1/")
+            or scope["path"] in self.public_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        authorization = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+
+        scheme, _, token = authorization.partition(b" ")
+        if not (scheme and token):
+            await _send_json_error(send, 403, _NOT_AUTHENTICATED_BODY)
+            return
+        if scheme.lower() != b"bearer":
+            await _send_json_error(send, 403, _INVALID_CREDENTIALS_BODY)
+            return
+        if not secrets.compare_digest(token, self.api_key):
+            logger.warning("Invalid API key attempt")
+            await _send_json_error(send, 401, _INVALID_API_KEY_BODY)
+            return
+
+        await self.app(scope, receive, send)
+
+
+async def _send_json_error(send: Send, status: int, body: bytes) -> None:
+    """Send a complete JSON error response"""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
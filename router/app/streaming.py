@@ -2,10 +2,11 @@
 Streaming handlers for tool calling support
 Handles buffered streaming with tool detection and usage statistics
 """
-import json
 import logging
 import time
-from typing import AsyncIterator, Optional, Dict, Any, List
+from typing import AsyncIterator
+
+import orjson
 
 try:
     import tiktoken
@@ -71,7 +72,7 @@ def create_usage_chunk(
         model: Model name
 
     Returns:
-        Formatted SSE chunk with usage data
+        Usage chunk as a JSON event payload
     """
     usage_data = {
         "id": chunk_id,
@@ -86,11 +87,11 @@ def create_usage_chunk(
         }
     }
 
-    return f"data: {json.dumps(usage_data)}\n\n"
+    return orjson.dumps(usage_data).decode()
 
 
 async def stream_with_tool_detection(
-    backend_stream: AsyncIterator[str],
+    backend_lines: AsyncIterator[str],
     request,
     model: str
 ) -> AsyncIterator[str]:
@@ -98,22 +99,23 @@ async def stream_with_tool_detection(
     Enhanced streaming that buffers output to detect tool calls and add usage stats.
 
     This function:
-    1. Collects all streaming chunks
+    1. Collects all streamed events
     2. Detects tool calls in the complete response
-    3. Modifies chunks to inject tool_calls if detected
-    4. Adds usage statistics chunk if requested
+    3. Modifies events to inject tool_calls if detected
+    4. Adds usage statistics event if requested
 
     Args:
-        backend_stream: Async iterator of backend response chunks
+        backend_lines: Async iterator over the backend's SSE lines
         request: Original request object
         model: Model name for token counting
 
     Yields:
-        Modified streaming chunks as strings
+        Event payloads (the text after "data: "), framed by EventSourceResponse
     """
     from .tool_parsing import extract_tool_calls_from_text
 
-    chunks = []
+    # (payload, parsed JSON or None) per event, so each payload is parsed only once
+    events = []
     full_content = ""
     chunk_id = None
     prompt_text = ""
@@ -133,20 +135,19 @@ async def stream_with_tool_detection(
             tool_prompt = tools_to_system_prompt(request.tools)
             prompt_text += tool_prompt
 
-    # Collect all chunks and build full content
-    logger.debug("Buffering streaming chunks for tool detection")
-    async for chunk_str in backend_stream:
-        chunks.append(chunk_str)
-
-        # Parse chunk to extract content
-        if chunk_str.startswith('data: '):
-            data_str = chunk_str[6:].strip()
+    # Collect all events and build full content
+    logger.debug("Buffering streaming events for tool detection")
+    async for line in backend_lines:
+        # Blank separator and comment lines are dropped; events are re-framed on output
+        if not line.startswith('data: '):
+            continue
 
-            if data_str == '[DONE]':
-                continue
+        data_str = line[6:].strip()
+        chunk_data = None
 
+        if data_str != '[DONE]':
             try:
-                chunk_data = json.loads(data_str)
+                chunk_data = orjson.loads(data_str)
 
                 # Extract chunk ID
                 if not chunk_id and 'id' in chunk_data:
@@ -159,11 +160,12 @@ async def stream_with_tool_detection(
                     if content:
                         full_content += content
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.debug(f"Could not parse chunk: {data_str[:100]}")
-                continue
 
-    logger.debug(f"Collected {len(chunks)} chunks, content length: {len(full_content)}")
+        events.append((data_str, chunk_data))
+
+    logger.debug(f"Collected {len(events)} events, content length: {len(full_content)}")
 
     # Detect tool calls in complete content
     tool_calls = None
@@ -172,71 +174,32 @@ async def stream_with_tool_detection(
         if tool_calls:
             logger.info(f"Detected {len(tool_calls)} tool call(s) in streaming response")
 
-    # Stream chunks with modifications
-    for i, chunk_str in enumerate(chunks):
-        if not chunk_str.startswith('data: '):
-            yield chunk_str
-            continue
-
-        data_str = chunk_str[6:].strip()
-
+    # Stream events with modifications
+    for data_str, chunk_data in events:
         if data_str == '[DONE]':
             # Before [DONE], inject usage chunk if requested
             if request.stream_options and request.stream_options.get("include_usage"):
                 prompt_tokens = count_tokens(prompt_text, model)
                 completion_tokens = count_tokens(full_content, model)
 
-                usage_chunk = create_usage_chunk(
+                yield create_usage_chunk(
                     prompt_tokens,
                     completion_tokens,
                     chunk_id or "chatcmpl-unknown",
                     model
                 )
-                yield usage_chunk
 
-            yield chunk_str
+            yield data_str
             continue
 
-        try:
-            chunk_data = json.loads(data_str)
-
-            # Check if this is the last chunk with finish_reason
-            if 'choices' in chunk_data and chunk_data['choices']:
-                choice = chunk_data['choices'][0]
-
-                # Inject tool_calls in the final chunk
-                if tool_calls and choice.get('finish_reason'):
-                    # Modify delta to include tool_calls
-                    if 'delta' not in choice:
-                        choice['delta'] = {}
-
-                    choice['delta']['tool_calls'] = tool_calls
-                    choice['finish_reason'] = 'tool_calls'
-
-                    # Update chunk data
-                    chunk_data['choices'][0] = choice
-                    yield f"data: {json.dumps(chunk_data)}\n\n"
-                    continue
-
-            # Yield unmodified chunk
-            yield chunk_str
-
-        except json.JSONDecodeError:
-            # If we can't parse, just pass through
-            yield chunk_str
-
-
-async def simple_stream_passthrough(
-    backend_stream: AsyncIterator[str]
-) -> AsyncIterator[str]:
-    """
-    Simple passthrough for streaming when no tool processing needed.
-
-    Args:
-        backend_stream: Async iterator of backend response chunks
+        # Inject tool_calls in the final chunk (the one with finish_reason)
+        if tool_calls and chunk_data and chunk_data.get('choices'):
+            choice = chunk_data['choices'][0]
+            if choice.get('finish_reason'):
+                choice.setdefault('delta', {})['tool_calls'] = tool_calls
+                choice['finish_reason'] = 'tool_calls'
+                yield orjson.dumps(chunk_data).decode()
+                continue
 
-    Yields:
-        Chunks as-is from backend
-    """
-    async for chunk in backend_stream:
-        yield chunk
+        # Yield unmodified event
+        yield data_str
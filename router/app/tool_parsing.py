@@ -2,13 +2,14 @@
 Tool call detection and parsing from model responses
 Supports multiple patterns: JSON code blocks, XML-style tags, and direct JSON
 """
-import json
 import re
 import secrets
 import string
 import logging
 from typing import List, Optional, Dict, Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +49,7 @@ def extract_tool_calls_from_text(content: str) -> Optional[List[Dict[str, Any]]]
 
     for match in matches:
         try:
-            parsed = json.loads(match)
+            parsed = orjson.loads(match)
             if "tool_calls" in parsed and isinstance(parsed["tool_calls"], list):
                 tool_calls = parsed["tool_calls"]
                 # Validate and normalize tool calls
@@ -63,13 +64,13 @@ def extract_tool_calls_from_text(content: str) -> Optional[List[Dict[str, Any]]]
                 if normalized:
                     logger.debug(f"Extracted {len(normalized)} tool call(s) from JSON code block")
                     return normalized
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.debug(f"Failed to parse JSON code block: {e}")
             continue
 
     # Pattern 2: Direct JSON object
     try:
-        parsed = json.loads(content.strip())
+        parsed = orjson.loads(content.strip())
         if isinstance(parsed, dict) and "tool_calls" in parsed:
             tool_calls = parsed["tool_calls"]
             if isinstance(tool_calls, list):
@@ -83,7 +84,7 @@ def extract_tool_calls_from_text(content: str) -> Optional[List[Dict[str, Any]]]
                 if normalized:
                     logger.debug(f"Extracted {len(normalized)} tool call(s) from direct JSON")
                     return normalized
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         pass
 
     # Pattern 3: XML-style tool call tags
@@ -94,12 +95,12 @@ def extract_tool_calls_from_text(content: str) -> Optional[List[Dict[str, Any]]]
         tool_calls = []
         for xml_content in xml_matches:
             try:
-                parsed = json.loads(xml_content.strip())
+                parsed = orjson.loads(xml_content.strip())
                 if validate_tool_call_structure(parsed):
                     if not parsed.get('id'):
                         parsed['id'] = generate_tool_call_id()
                     tool_calls.append(parsed)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.debug(f"Failed to parse XML-style tool call content")
                 continue
 
@@ -117,12 +118,12 @@ def extract_tool_calls_from_text(content: str) -> Optional[List[Dict[str, Any]]]
         for match in function_matches:
             try:
                 # Wrap in tool_calls array format if needed
-                parsed = json.loads(match)
+                parsed = orjson.loads(match)
                 if validate_tool_call_structure(parsed):
                     if not parsed.get('id'):
                         parsed['id'] = generate_tool_call_id()
                     tool_calls.append(parsed)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
 
         if tool_calls:
@@ -176,8 +177,8 @@ def validate_tool_call_structure(tool_call: Dict[str, Any]) -> bool:
 
     # Try to parse arguments as JSON to ensure it's valid
     try:
-        json.loads(function['arguments'])
-    except json.JSONDecodeError:
+        orjson.loads(function['arguments'])
+    except orjson.JSONDecodeError:
         logger.debug(f"Invalid tool call: arguments is not valid JSON: {function['arguments']}")
         return False
 
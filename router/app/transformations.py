@@ -2,10 +2,11 @@
 Tool calling transformations for OpenAI-compatible API
 Handles injection of tool definitions into prompts and extraction from responses
 """
-import json
 import logging
 from typing import List, Optional, Dict, Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,7 +68,7 @@ def tools_to_system_prompt(tools: List) -> str:
         tool_descs.append(f"""
 Function: {func_dict.get('name', 'unknown')}
 Description: {func_dict.get('description', 'No description')}
-Parameters: {json.dumps(func_dict.get('parameters', {}), indent=2)}
+Parameters: {orjson.dumps(func_dict.get('parameters', {}), option=orjson.OPT_INDENT_2).decode()}
 """)
 
     return f"""# Available Functions
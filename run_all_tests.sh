@@ -44,6 +44,9 @@ run_test() {
 # Run tests in order of importance
 run_test "GPU Exclusive Access" "python3 test_gpu_exclusive.py" || true
 run_test "CORS Configuration" "python3 test_cors.py" || true
+run_test "Auth Middleware" "python3 test_auth_middleware.py" || true
+run_test "Chat Passthrough" "python3 test_passthrough.py" || true
+run_test "Container GPU Memory" "python3 test_gpu_memory.py" || true
 run_test "Real User Simulation" "python3 test_actual_user.py" || true
 run_test "Playwright E2E Tests" "python3 test_e2e_playwright.py" || true
 run_test "API Tests" "python3 test_service.py" || true
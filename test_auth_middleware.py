@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Auth Middleware Tests
+Checks AuthMiddleware keeps the status codes and error bodies of the
+FastAPI HTTPBearer dependency it replaced. Runs in-process, no server needed.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "router"))
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from fastapi.testclient import TestClient
+
+from app.middleware import AuthMiddleware
+
+API_KEY = "sk-test-key"
+
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+app = Starlette(routes=[
+    Route("/v1/models", ok, methods=["GET", "OPTIONS"]),
+    Route("/v1/api/info", ok),
+])
+app.add_middleware(AuthMiddleware, api_key=API_KEY, public_paths={"/v1/api/info"})
+client = TestClient(app)
+
+
+def test_missing_token():
+    """Requests without an Authorization header get 403 Not authenticated"""
+    print("\n" + "="*70)
+    print("Test 1: Missing token")
+    print("="*70)
+
+    response = client.get("/v1/models")
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 403, f"Expected 403, got {response.status_code}"
+    assert response.json() == {"detail": "Not authenticated"}, response.text
+
+    print("✓ PASS: Missing token rejected")
+    return True
+
+
+def test_malformed_token():
+    """Non-bearer credentials get 403 Invalid authentication credentials"""
+    print("\n" + "="*70)
+    print("Test 2: Malformed token")
+    print("="*70)
+
+    response = client.get("/v1/models", headers={"Authorization": f"Basic {API_KEY}"})
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 403, f"Expected 403, got {response.status_code}"
+    assert response.json() == {"detail": "Invalid authentication credentials"}, response.text
+
+    print("✓ PASS: Malformed token rejected")
+    return True
+
+
+def test_wrong_token():
+    """A bearer token that doesn't match the API key gets 401 invalid_api_key"""
+    print("\n" + "="*70)
+    print("Test 3: Wrong token")
+    print("="*70)
+
+    response = client.get("/v1/models", headers={"Authorization": "Bearer sk-wrong"})
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+    assert response.json()["detail"]["error"]["code"] == "invalid_api_key", response.text
+
+    print("✓ PASS: Wrong token rejected")
+    return True
+
+
+def test_valid_token():
+    """The configured API key is accepted, in any case of the bearer scheme"""
+    print("\n" + "="*70)
+    print("Test 4: Valid token")
+    print("="*70)
+
+    for scheme in ("Bearer", "bearer"):
+        response = client.get("/v1/models", headers={"Authorization": f"{scheme} {API_KEY}"})
+        print(f"{scheme}: {response.status_code}")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+    print("✓ PASS: Valid token accepted")
+    return True
+
+
+def test_public_path():
+    """/v1/api/info is served without a token"""
+    print("\n" + "="*70)
+    print("Test 5: Public path")
+    print("="*70)
+
+    response = client.get("/v1/api/info")
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+    print("✓ PASS: Public path needs no token")
+    return True
+
+
+def test_options_preflight():
+    """OPTIONS requests pass through so CORS preflights never need a token"""
+    print("\n" + "="*70)
+    print("Test 6: OPTIONS preflight")
+    print("="*70)
+
+    response = client.options("/v1/models")
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+    print("✓ PASS: OPTIONS skips authentication")
+    return True
+
+
+def run_all_tests():
+    """Run all auth middleware tests"""
+    print("="*70)
+    print("AUTH MIDDLEWARE TESTS")
+    print("="*70)
+
+    results = []
+
+    try:
+        results.append(("Missing token", test_missing_token()))
+        results.append(("Malformed token", test_malformed_token()))
+        results.append(("Wrong token", test_wrong_token()))
+        results.append(("Valid token", test_valid_token()))
+        results.append(("Public path", test_public_path()))
+        results.append(("OPTIONS preflight", test_options_preflight()))
+    except Exception as e:
+        print(f"\n✗ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+
+    passed = sum(1 for _, result in results if result)
+
+    for test_name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status:8} - {test_name}")
+
+    print(f"\nTotal: {passed}/{len(results)} passed")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Chat Completion Passthrough Tests
+Checks which requests skip ChatCompletionRequest validation and what the
+backend receives when they do. Runs in-process against a mocked backend.
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "router"))
+
+import httpx
+from fastapi.testclient import TestClient
+
+import app.main as router_main
+from app.config import settings
+
+MODEL = "mistral-7b-v0.1"
+HEADERS = {"Authorization": f"Bearer {settings.api_key}"}
+
+STREAM_BODY = b'data: {"id":"chatcmpl-test","choices":[{"delta":{"content":"hi"}}]}\n\ndata: [DONE]\n\n'
+
+backend_payloads = []
+
+
+def backend(request):
+    body = json.loads(request.content)
+    backend_payloads.append(body)
+    if body.get("stream"):
+        return httpx.Response(200, content=STREAM_BODY, headers={"content-type": "text/event-stream; charset=utf-8"})
+    return httpx.Response(200, json={
+        "id": "chatcmpl-test",
+        "choices": [{"message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+    })
+
+
+router_main.http_client = httpx.AsyncClient(transport=httpx.MockTransport(backend))
+client = TestClient(router_main.app)
+
+
+def test_passthrough_rules():
+    """Plain requests pass through; anything needing processing or validation doesn't"""
+    print("\n" + "="*70)
+    print("Test 1: Passthrough rules")
+    print("="*70)
+
+    user = {"role": "user", "content": "a"}
+    cases = [
+        ({"model": MODEL, "messages": [user]}, True),
+        ({"model": MODEL, "messages": [user], "stream": True}, True),
+        ({"model": MODEL, "messages": [user], "stream_options": {"include_usage": False}}, True),
+        ({"model": MODEL, "messages": [user], "tools": [{"type": "function"}]}, False),
+        ({"model": MODEL, "messages": [user], "stream_options": {"include_usage": True}}, False),
+        ({"model": MODEL, "messages": [user], "stream_options": "yes"}, False),
+        ({"model": MODEL, "messages": [user], "stream": "true"}, False),
+        ({"model": MODEL, "messages": [{"role": "robot", "content": "a"}]}, False),
+        ({"model": MODEL, "messages": [{"content": "a"}]}, False),
+        ({"model": MODEL, "messages": ["a"]}, False),
+        ({"model": MODEL, "messages": user}, False),
+        ({"model": 7, "messages": [user]}, False),
+        ({"messages": [user]}, False),
+        ([user], False),
+    ]
+
+    for data, expected in cases:
+        result = router_main._is_passthrough(data)
+        print(f"{'✓' if result == expected else '✗'} {result!s:5} {data}")
+        assert result == expected, f"Expected {expected} for {data}"
+
+    print("✓ PASS: Passthrough rules hold")
+    return True
+
+
+def test_passthrough_payload():
+    """The backend gets the client's request with the model rewritten and nulls dropped"""
+    print("\n" + "="*70)
+    print("Test 2: Passthrough payload")
+    print("="*70)
+
+    response = client.post("/v1/chat/completions", headers=HEADERS, json={
+        "model": MODEL,
+        "messages": [
+            {"role": "system", "content": "s", "name": None},
+            {"role": "user", "content": [{"type": "text", "text": "a"}], "tool_calls": None},
+        ],
+        "max_tokens": 5,
+        "seed": None,
+        "top_k": 20,
+    })
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+    payload = backend_payloads[-1]
+    print(f"Backend payload: {payload}")
+    assert payload["model"] == router_main.resolve_model(MODEL)[1], payload["model"]
+    assert payload["messages"] == [
+        {"role": "system", "content": "s"},
+        {"role": "user", "content": "a"},
+    ], payload["messages"]
+    assert "seed" not in payload, "Null request fields must not reach the backend"
+    assert payload["top_k"] == 20, "Extra sampling parameters must be forwarded"
+    assert payload["temperature"] == 1.0 and payload["top_p"] == 1.0, "Request defaults missing"
+
+    print("✓ PASS: Backend payload is correct")
+    return True
+
+
+def test_passthrough_stream():
+    """Streamed backend bytes reach the client unchanged, with a single charset"""
+    print("\n" + "="*70)
+    print("Test 3: Passthrough stream")
+    print("="*70)
+
+    response = client.post("/v1/chat/completions", headers=HEADERS, json={
+        "model": MODEL,
+        "messages": [{"role": "user", "content": "a"}],
+        "stream": True,
+    })
+    print(f"Status code: {response.status_code}")
+    print(f"Content-Type: {response.headers.get('content-type')}")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert response.headers["content-type"] == "text/event-stream; charset=utf-8", response.headers["content-type"]
+    assert response.content == STREAM_BODY, response.content
+
+    print("✓ PASS: Stream passed through")
+    return True
+
+
+def test_invalid_role_rejected():
+    """A message with an unknown role falls back to validation and gets a 422"""
+    print("\n" + "="*70)
+    print("Test 4: Invalid role")
+    print("="*70)
+
+    sent = len(backend_payloads)
+    response = client.post("/v1/chat/completions", headers=HEADERS, json={
+        "model": MODEL,
+        "messages": [{"role": "robot", "content": "a"}],
+    })
+    print(f"Status code: {response.status_code}")
+    assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+    assert len(backend_payloads) == sent, "Invalid request reached the backend"
+
+    print("✓ PASS: Invalid role rejected")
+    return True
+
+
+def run_all_tests():
+    """Run all passthrough tests"""
+    print("="*70)
+    print("CHAT COMPLETION PASSTHROUGH TESTS")
+    print("="*70)
+
+    results = []
+
+    try:
+        results.append(("Passthrough rules", test_passthrough_rules()))
+        results.append(("Passthrough payload", test_passthrough_payload()))
+        results.append(("Passthrough stream", test_passthrough_stream()))
+        results.append(("Invalid role", test_invalid_role_rejected()))
+    except Exception as e:
+        print(f"\n✗ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+
+    passed = sum(1 for _, result in results if result)
+
+    for test_name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status:8} - {test_name}")
+
+    print(f"\nTotal: {passed}/{len(results)} passed")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)